@@ -0,0 +1,23 @@
+"""Shared setup for the MCP-server debug scripts in this directory.
+
+Run the scripts from the project root (the root is taken from the cwd):
+  .venv/bin/python scripts/archive/historical/simulate_add_memory.py
+
+Chaining helpers in one REPL reuses a single server:
+  >>> from _common import get_server
+"""
+
+import functools
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.getcwd())
+
+
+@functools.lru_cache(maxsize=1)
+def get_server():
+    """Build the ElefanteMCPServer once per process (its imports are heavy)."""
+    from src.mcp.server import ElefanteMCPServer
+
+    return ElefanteMCPServer()
@@ -69,31 +69,37 @@ async def add_debugging_lessons():
     print("Adding debugging lessons to Elefante memory...")
     print("=" * 70)
     
-    for i, lesson in enumerate(lessons, 1):
-        try:
-            result = await orchestrator.add_memory(
-                content=lesson["content"],
-                memory_type=lesson["memory_type"],
-                importance=lesson["importance"],
-                tags=lesson["tags"]
-            )
-            print(f"[OK] Lesson {i}/{len(lessons)} added")
-            print(f"     Type: {lesson['memory_type']}, Importance: {lesson['importance']}")
-            print(f"     Preview: {lesson['content'][:80]}...")
-            print()
-        except Exception as e:
-            print(f"[FAIL] Failed to add lesson {i}: {e}")
-            print()
+    # Queue every lesson for the background writer, then wait once for the batch
+    pending = [orchestrator.enqueue_memory(lesson) for lesson in lessons]
+    await orchestrator.flush()
     
-    print("=" * 70)
-    print("Lesson addition complete!")
+    report = []
+    for i, (lesson, future) in enumerate(zip(lessons, pending), 1):
+        # A lesson whose batch was cancelled (writer stopped) has no exception
+        # to report, and exception() would raise CancelledError on it
+        if future.cancelled():
+            report += [f"[FAIL] Failed to add lesson {i}: write was cancelled", ""]
+            continue
+        if future.exception() is not None:
+            report += [f"[FAIL] Failed to add lesson {i}: {future.exception()}", ""]
+            continue
+        report += [
+            f"[OK] Lesson {i}/{len(lessons)} added",
+            f"     Type: {lesson['memory_type']}, Importance: {lesson['importance']}",
+            f"     Preview: {lesson['content'][:80]}...",
+            "",
+        ]
+    report += ["=" * 70, "Lesson addition complete!", "", "Verifying system state..."]
+    # One write for the whole report instead of a print per line
+    sys.stdout.write("\n".join(report) + "\n")
     
     # Verify memories were added
-    print("\nVerifying system state...")
     stats = await orchestrator.get_stats()
-    print(f"Total memories in system: {stats.get('vector_store', {}).get('total_memories', 0)}")
-    print(f"Total entities in graph: {stats.get('graph_store', {}).get('total_entities', 0)}")
-    print("\nThese lessons will help prevent similar issues in future debugging sessions.")
+    sys.stdout.write(
+        f"Total memories in system: {stats.get('vector_store', {}).get('total_memories', 0)}\n"
+        f"Total entities in graph: {stats.get('graph_store', {}).get('total_entities', 0)}\n"
+        "\nThese lessons will help prevent similar issues in future debugging sessions.\n"
+    )
 
 if __name__ == "__main__":
     asyncio.run(add_debugging_lessons())
@@ -57,26 +57,25 @@ async def add_user_preferences():
     print("Adding user preference memories and critical lessons...")
     print("=" * 60)
     
-    for i, mem in enumerate(memories, 1):
-        try:
-            result = await orchestrator.add_memory(
-                content=mem["content"],
-                memory_type=mem["memory_type"],
-                importance=mem["importance"],
-                tags=mem["tags"]
-            )
-            print(f"[OK] Memory {i}/{len(memories)} added: {result}")
-        except Exception as e:
-            print(f"[FAIL] Failed to add memory {i}: {e}")
+    # Bulk add: the specs are add_memory() kwargs, embedded in one batch
+    results = await orchestrator.add_memories(memories, return_exceptions=True)
     
-    print("=" * 60)
-    print("Memory addition complete!")
+    report = []
+    for i, result in enumerate(results, 1):
+        if isinstance(result, Exception):
+            report.append(f"[FAIL] Failed to add memory {i}: {result}")
+        else:
+            report.append(f"[OK] Memory {i}/{len(memories)} added: {result}")
+    report += ["=" * 60, "Memory addition complete!", "", "Verifying memories..."]
+    # One write for the whole report instead of a print per line
+    sys.stdout.write("\n".join(report) + "\n")
     
     # Verify memories were added
-    print("\nVerifying memories...")
     stats = await orchestrator.get_stats()
-    print(f"Total memories in system: {stats.get('vector_store', {}).get('total_memories', 0)}")
-    print(f"Total entities in graph: {stats.get('graph_store', {}).get('total_entities', 0)}")
+    sys.stdout.write(
+        f"Total memories in system: {stats.get('vector_store', {}).get('total_memories', 0)}\n"
+        f"Total entities in graph: {stats.get('graph_store', {}).get('total_entities', 0)}\n"
+    )
 
 if __name__ == "__main__":
     asyncio.run(add_user_preferences())
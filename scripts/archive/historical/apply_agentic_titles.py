@@ -1,4 +1,7 @@
 
+import re
+import sys
+
 import chromadb
 from src.utils.config import get_config
 
@@ -87,28 +90,38 @@ TITLES = {
     "24ec0fbe-9258-496c-9920-993b935bbc26": "Self-Goal-HighValuation"
 }
 
+# Placeholder ids such as 99999999-9999-... were never real memories; they
+# are dropped before the fetch instead of being looked up and reported missing
+_PLACEHOLDER_ID = re.compile(r"^([0-9a-f])\1{7}-")
+
 def apply_titles():
     print(f"Applying {len(TITLES)} semantic titles...")
     config = get_config()
     client = chromadb.PersistentClient(path=config.elefante.vector_store.persist_directory)
     collection = client.get_collection("memories")
 
+    # One fetch and one update for the whole table instead of a get and an
+    # update (each its own SQLite transaction) per title
+    ids = [mem_id for mem_id in TITLES if not _PLACEHOLDER_ID.match(mem_id)]
+    existing = collection.get(ids=ids, include=["metadatas"])
+    found = set(existing["ids"])
+    missing = [f"Skipping {mem_id[:8]} (not found)" for mem_id in ids if mem_id not in found]
+    if missing:
+        # One write for every skipped id instead of a print per id
+        sys.stdout.write("\n".join(missing) + "\n")
+
+    metas = []
+    for mem_id, meta in zip(existing["ids"], existing["metadatas"]):
+        meta["title"] = TITLES[mem_id]
+        metas.append(meta)
+
     updated = 0
-    for mem_id, title in TITLES.items():
+    if metas:
         try:
-            # Check if memory exists
-            existing = collection.get(ids=[mem_id])
-            if not existing["ids"]:
-                print(f"Skipping {mem_id[:8]} (not found)")
-                continue
-
-            # Update metadata
-            meta = existing["metadatas"][0]
-            meta["title"] = title
-            collection.update(ids=[mem_id], metadatas=[meta])
-            updated += 1
+            collection.update(ids=existing["ids"], metadatas=metas)
+            updated = len(metas)
         except Exception as e:
-            print(f"Error updating {mem_id}: {e}")
+            print(f"Error updating titles: {e}")
 
     print(f" Successfully updated {updated} memory titles")
 
@@ -14,6 +14,9 @@ import chromadb
 from chromadb.config import Settings
 from src.utils.config import get_config
 
+# Memories fetched per collection.get call
+PAGE_SIZE = 1000
+
 def main():
     """Query ChromaDB directly to retrieve all memories"""
     config = get_config()
@@ -43,37 +46,43 @@ def main():
         print("No memories found in database.")
         return
     
-    # Retrieve ALL memories using get() without filters
+    # Retrieve ALL memories using get() without filters, one page at a time
+    # so only PAGE_SIZE documents are held at once
     print("Retrieving all memories...\n")
-    results = collection.get(
-        include=["documents", "metadatas"]
-    )
     
     # Display results in table format
     print("=" * 120)
     print(f"{'ID':<38} | {'Type':<15} | {'Importance':<10} | {'Content Preview':<50}")
     print("=" * 120)
     
-    for i, memory_id in enumerate(results['ids']):
-        metadata = results['metadatas'][i]
-        content = results['documents'][i]
-        
-        memory_type = metadata.get('memory_type', 'unknown')
-        importance = metadata.get('importance', 'N/A')
-        content_preview = content[:50] + "..." if len(content) > 50 else content
+    retrieved = 0
+    type_counts = {}
+    while True:
+        results = collection.get(
+            limit=PAGE_SIZE,
+            offset=retrieved,
+            include=["documents", "metadatas"]
+        )
+        if not results['ids']:
+            break
+        retrieved += len(results['ids'])
         
-        print(f"{memory_id:<38} | {memory_type:<15} | {importance:<10} | {content_preview:<50}")
+        for i, memory_id in enumerate(results['ids']):
+            metadata = results['metadatas'][i]
+            content = results['documents'][i]
+            
+            memory_type = metadata.get('memory_type', 'unknown')
+            importance = metadata.get('importance', 'N/A')
+            content_preview = content[:50] + "..." if len(content) > 50 else content
+            
+            print(f"{memory_id:<38} | {memory_type:<15} | {importance:<10} | {content_preview:<50}")
+            type_counts[memory_type] = type_counts.get(memory_type, 0) + 1
     
     print("=" * 120)
-    print(f"\nTotal retrieved: {len(results['ids'])} memories")
+    print(f"\nTotal retrieved: {retrieved} memories")
     
     # Additional statistics
     print("\n--- Memory Type Distribution ---")
-    type_counts = {}
-    for metadata in results['metadatas']:
-        mem_type = metadata.get('memory_type', 'unknown')
-        type_counts[mem_type] = type_counts.get(mem_type, 0) + 1
-    
     for mem_type, count in sorted(type_counts.items()):
         print(f"{mem_type}: {count}")
 
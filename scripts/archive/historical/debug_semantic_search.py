@@ -2,6 +2,11 @@
 
 Run:
   .venv/bin/python scripts/debug_semantic_search.py
+
+Iterate from one long-lived loop (collection and embeddings stay warm):
+  .venv/bin/python -m asyncio
+  >>> from debug_semantic_search import main
+  >>> await main()
 """
 
 import asyncio
@@ -12,8 +17,25 @@ from chromadb.config import Settings
 from src.core.embeddings import get_embedding_service
 from src.utils.config import get_config
 
+# Query text -> embedding; several test queries repeat with different thresholds
+_query_embeddings = {}
+
+# Opened once per process so repeated main() calls skip client start-up
+_collection = None
+
+
+async def embed_query(query: str):
+    if query not in _query_embeddings:
+        embedding_service = get_embedding_service()
+        _query_embeddings[query] = await embedding_service.generate_embedding(query)
+    return _query_embeddings[query]
+
+
+def open_collection():
+    global _collection
+    if _collection is not None:
+        return _collection
 
-async def test_search(query: str, min_similarity: float = 0.0):
     config = get_config()
     persist_dir = config.elefante.vector_store.persist_directory
     collection_name = config.elefante.vector_store.collection_name
@@ -26,17 +48,22 @@ async def test_search(query: str, min_similarity: float = 0.0):
         ),
     )
 
-    collection = client.get_collection(name=collection_name)
+    _collection = client.get_collection(name=collection_name)
+    return _collection
+
 
-    embedding_service = get_embedding_service()
-    query_embedding = await embedding_service.generate_embedding(query)
+async def run_search(collection, query: str):
+    query_embedding = await embed_query(query)
 
-    results = collection.query(
+    return await asyncio.to_thread(
+        collection.query,
         query_embeddings=[query_embedding],
         n_results=50,
         include=["documents", "metadatas", "distances"],
     )
 
+
+def print_results(query: str, min_similarity: float, results):
     print(f"\n{'=' * 120}")
     print(f"Query: '{query}'")
     print(f"Min Similarity Threshold: {min_similarity}")
@@ -83,11 +110,27 @@ async def main():
         ("", 0.0),
     ]
 
+    # The collection is resolved once for every query (and every later run);
+    # searches are independent, so each unique query runs concurrently and
+    # the report is printed in the original order
+    queries = list(dict.fromkeys(query for query, _ in test_queries))
+    try:
+        collection = open_collection()
+    except Exception as e:
+        # Reported per query, as a failed search is
+        outcomes = [e] * len(queries)
+    else:
+        outcomes = await asyncio.gather(
+            *(run_search(collection, query) for query in queries), return_exceptions=True
+        )
+    results_by_query = dict(zip(queries, outcomes))
+
     for query, min_sim in test_queries:
-        try:
-            await test_search(query, min_sim)
-        except Exception as e:
-            print(f"\nERROR with query '{query}': {e}\n")
+        results = results_by_query[query]
+        if isinstance(results, Exception):
+            print(f"\nERROR with query '{query}': {results}\n")
+            continue
+        print_results(query, min_sim, results)
 
 
 if __name__ == "__main__":
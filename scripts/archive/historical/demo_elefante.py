@@ -12,9 +12,7 @@ sys.path.append(os.getcwd())
 from src.mcp.server import ElefanteMCPServer
 
 def print_header(title):
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print(f"{'='*60}\n")
+    print(f"\n{'='*60}\n  {title}\n{'='*60}\n")
 
 def print_result(result):
     print(json.dumps(result, indent=2, default=str))
@@ -102,8 +100,10 @@ async def demo():
     result = await server._handle_list_all_memories({"limit": 10})
     print(f"Total memories: {result.get('count', 0)}")
     if result.get('memories'):
-        for i, mem in enumerate(result['memories'][:3]):
-            print(f"  {i+1}. {mem.get('content', '')[:50]}...")
+        print("\n".join(
+            f"  {i+1}. {mem.get('content', '')[:50]}..."
+            for i, mem in enumerate(result['memories'][:3])
+        ))
     input("\nPress Enter to continue...")
     
     # =========================================================================
@@ -147,7 +147,12 @@ async def demo():
     print("\nThe MCP server is still running. Use these tools from your IDE!")
 
 if __name__ == "__main__":
+    # uvloop is optional (and unavailable on Windows); fall back to asyncio
     try:
-        asyncio.run(demo())
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+    try:
+        run(demo())
     except KeyboardInterrupt:
         print("\n\nDemo interrupted")
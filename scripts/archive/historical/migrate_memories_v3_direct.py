@@ -7,7 +7,6 @@ Purpose:
 - Persist `layer`, `sublayer`, and `importance` into ChromaDB metadata
 """
 
-import asyncio
 import sys
 import os
 
@@ -21,7 +20,7 @@ from src.core.classifier import classify_memory_full
 from src.utils.config import get_config
 
 
-async def migrate_v3():
+def migrate_v3():
     config = get_config()
     chroma_path = config.elefante.vector_store.persist_directory
 
@@ -88,4 +87,4 @@ async def migrate_v3():
 
 
 if __name__ == "__main__":
-    asyncio.run(migrate_v3())
+    migrate_v3()
@@ -19,6 +19,9 @@ from collections import Counter
 from src.core.llm import get_llm_service
 from src.utils.config import get_config
 
+# Title updates are written to ChromaDB this many at a time
+UPDATE_BATCH_SIZE = 50
+
 
 async def migrate_titles():
     """Regenerate titles for all memories using LLM."""
@@ -56,6 +59,22 @@ async def migrate_titles():
     errors = 0
     title_lengths = []
     sample_titles = []
+    pending_ids: list[str] = []
+    pending_meta: list[dict] = []
+    
+    def flush():
+        """Write the pending title updates in one ChromaDB call."""
+        nonlocal updated, errors
+        if not pending_ids:
+            return
+        try:
+            collection.update(ids=pending_ids, metadatas=pending_meta)
+        except Exception as e:
+            print(f"   Error updating {len(pending_ids)} memories: {e}")
+            updated -= len(pending_ids)
+            errors += len(pending_ids)
+        pending_ids.clear()
+        pending_meta.clear()
     
     for i, (mem_id, content, metadata) in enumerate(zip(
         all_data["ids"],
@@ -78,14 +97,13 @@ async def migrate_titles():
             # Update metadata
             metadata["title"] = new_title
             
-            # Update in ChromaDB
-            collection.update(
-                ids=[mem_id],
-                metadatas=[metadata]
-            )
-            
+            # Queue for the next batched ChromaDB update
+            pending_ids.append(mem_id)
+            pending_meta.append(metadata)
             updated += 1
             title_lengths.append(len(new_title))
+            if len(pending_ids) >= UPDATE_BATCH_SIZE:
+                flush()
             
             # Keep samples
             if len(sample_titles) < 10:
@@ -104,6 +122,8 @@ async def migrate_titles():
             print(f"   Error processing {mem_id}: {e}")
             errors += 1
     
+    flush()
+    
     # Summary
     print("\n" + "=" * 60)
     print("MIGRATION COMPLETE")
@@ -5,10 +5,14 @@ V4 Migration Script - Backfill cognitive retrieval fields for existing memories.
 Adds: concepts, surfaces_when, authority_score to all memories in ChromaDB.
 """
 
-import asyncio
 import sys
 import os
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -21,7 +25,146 @@ from src.utils.curation import (
 )
 
 
-async def migrate_v4():
+# orjson is optional: faster on the small per-row lists, same JSON for readers
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps(value) -> str:
+        return _orjson_dumps(value).decode()
+except ImportError:
+    _dumps = json.dumps
+
+
+# Metadata rows per collection.update call; each call is one SQLite transaction
+BATCH_SIZE = 200
+
+# Memories fetched from ChromaDB per collection.get call
+PAGE_SIZE = 1000
+
+# Batched updates queued on the writer thread before compute waits for it
+MAX_PENDING_WRITES = 4
+
+# Memories handed to a worker process per task
+COMPUTE_CHUNK_SIZE = 64
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse a stored ISO timestamp to naive UTC; cached, as many memories share one."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00").replace("+00:00", ""))
+    except ValueError:
+        return None
+    # Any other offset leaves the value tz-aware, which cannot be subtracted
+    # from the naive utcnow(); treat it as unparseable
+    return None if parsed.tzinfo else parsed
+
+
+def _days_since(value: Optional[str], now: datetime) -> int:
+    """Whole days from a stored timestamp to ``now``; 0 if missing or unparseable."""
+    if not value or not isinstance(value, str):
+        return 0
+    parsed = _parse_timestamp(value)
+    return (now - parsed).days if parsed else 0
+
+
+# Authority of a memory with default importance/access and no timestamps,
+# a common shape among legacy rows
+_DEFAULT_AUTHORITY = compute_authority_score(
+    importance=5,
+    access_count=1,
+    days_since_created=0,
+    days_since_accessed=0,
+)
+
+
+@lru_cache(maxsize=4096)
+def _concept_fields(doc: str) -> tuple[str, str]:
+    """
+    Encoded (concepts, surfaces_when) for a document.
+
+    Both depend only on the text, and legacy collections hold many
+    duplicate documents, so results are cached per worker process.
+    """
+    # Extract concepts
+    concepts = extract_concepts(doc, max_concepts=5)
+    
+    # Infer surfaces_when
+    surfaces_when = infer_surfaces_when(doc, concepts)
+    
+    return _dumps(concepts), _dumps(surfaces_when)
+
+
+def _compute_fields(doc: str, meta: dict) -> tuple[str, str, float]:
+    """
+    Compute the V4 fields for one memory.
+
+    Top-level so ProcessPoolExecutor can pickle it.
+
+    Returns:
+        (concepts JSON, surfaces_when JSON, authority_score); ChromaDB
+        stores lists as JSON strings
+    """
+    concepts, surfaces_when = _concept_fields(doc)
+    
+    # Compute authority score
+    importance = int(meta.get("importance", 5))
+    access_count = int(meta.get("access_count", 1))
+    
+    created_str = meta.get("created_at") or meta.get("timestamp")
+    accessed_str = meta.get("last_accessed")
+    
+    if not created_str and not accessed_str and importance == 5 and access_count == 1:
+        # Untouched defaults: the score was computed once at import
+        authority_score = _DEFAULT_AUTHORITY
+    else:
+        now = datetime.utcnow()
+        authority_score = compute_authority_score(
+            importance=importance,
+            access_count=access_count,
+            days_since_created=_days_since(created_str, now),
+            days_since_accessed=_days_since(accessed_str, now),
+        )
+    
+    return concepts, surfaces_when, authority_score
+
+
+def _fetch_page(collection, offset: int):
+    """
+    Read one page and pick out the memories still missing V4 fields.
+
+    Returns:
+        (page ids, [(memory_id, document, metadata)] to migrate, skipped count)
+    """
+    page = collection.get(limit=PAGE_SIZE, offset=offset, include=["metadatas"])
+    
+    # Chroma's where filter cannot match a missing key, so the check stays
+    # client-side, on metadatas only
+    unmigrated = {}
+    skipped = 0
+    for i, memory_id in enumerate(page["ids"]):
+        meta = page["metadatas"][i] if page["metadatas"] else {}
+        
+        # Check if already has V4 fields
+        existing_concepts = meta.get("concepts")
+        if existing_concepts and isinstance(existing_concepts, str) and len(existing_concepts) > 2:
+            skipped += 1
+            continue
+        unmigrated[memory_id] = meta
+    if not unmigrated:
+        return page["ids"], [], skipped
+    
+    # Documents are only fetched for the rows that still need them
+    docs = collection.get(ids=list(unmigrated), include=["documents"])
+    doc_by_id = dict(zip(docs["ids"], docs["documents"] or []))
+    todo = [
+        (memory_id, doc_by_id.get(memory_id) or "", meta)
+        for memory_id, meta in unmigrated.items()
+    ]
+    return page["ids"], todo, skipped
+
+
+def migrate_v4():
     """Backfill V4 cognitive fields for all memories."""
     config = get_config()
     chroma_path = config.elefante.vector_store.persist_directory
@@ -30,80 +173,77 @@ async def migrate_v4():
     client = chromadb.PersistentClient(path=chroma_path)
     collection = client.get_collection("memories")
     
-    # Get all memories
-    all_memories = collection.get(include=["documents", "metadatas"])
-    total = len(all_memories["ids"])
+    total = collection.count()
     print(f"[*] Found {total} memories to migrate")
     
     updated = 0
     skipped = 0
+    pending_ids = []
+    pending_metas = []
+    sample_id = None
     
-    for i, memory_id in enumerate(all_memories["ids"]):
-        doc = all_memories["documents"][i] if all_memories["documents"] else ""
-        meta = all_memories["metadatas"][i] if all_memories["metadatas"] else {}
-        
-        # Check if already has V4 fields
-        existing_concepts = meta.get("concepts")
-        if existing_concepts and isinstance(existing_concepts, str) and len(existing_concepts) > 2:
-            skipped += 1
-            continue
-        
-        # Extract concepts
-        concepts = extract_concepts(doc, max_concepts=5)
-        
-        # Infer surfaces_when
-        surfaces_when = infer_surfaces_when(doc, concepts)
-        
-        # Compute authority score
-        importance = int(meta.get("importance", 5))
-        access_count = int(meta.get("access_count", 1))
-        
-        created_str = meta.get("created_at") or meta.get("timestamp")
-        accessed_str = meta.get("last_accessed")
-        
-        now = datetime.utcnow()
-        days_since_created = 0
-        days_since_accessed = 0
-        
-        if created_str:
-            try:
-                created = datetime.fromisoformat(created_str.replace("Z", "+00:00").replace("+00:00", ""))
-                days_since_created = (now - created).days
-            except:
-                pass
-        
-        if accessed_str:
-            try:
-                accessed = datetime.fromisoformat(accessed_str.replace("Z", "+00:00").replace("+00:00", ""))
-                days_since_accessed = (now - accessed).days
-            except:
-                pass
-        
-        authority_score = compute_authority_score(
-            importance=importance,
-            access_count=access_count,
-            days_since_created=days_since_created,
-            days_since_accessed=days_since_accessed,
-        )
-        
-        # Update metadata
-        # ChromaDB stores lists as JSON strings
-        import json
-        new_meta = dict(meta)
-        new_meta["concepts"] = json.dumps(concepts)
-        new_meta["surfaces_when"] = json.dumps(surfaces_when)
-        new_meta["authority_score"] = authority_score
-        
-        # Update in ChromaDB
-        collection.update(
-            ids=[memory_id],
-            metadatas=[new_meta],
-        )
-        
-        updated += 1
+    # Pipeline: the reader prefetches the next page and the writer commits
+    # updates while the process pool computes the current page. Each stage
+    # has one worker, so pages and writes stay in order; at most
+    # MAX_PENDING_WRITES updates are queued before compute waits on the writer
+    reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma-read")
+    writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma-write")
+    writes = deque()
+    
+    def flush():
+        if pending_ids:
+            writes.append(writer.submit(collection.update, ids=list(pending_ids), metadatas=list(pending_metas)))
+            pending_ids.clear()
+            pending_metas.clear()
+            while len(writes) > MAX_PENDING_WRITES:
+                writes.popleft().result()
+    
+    try:
+        with ProcessPoolExecutor() as executor:
+            # Page through the collection so only a few pages are held at once
+            offset = 0
+            next_page = reader.submit(_fetch_page, collection, offset)
+            while True:
+                page_ids, todo, page_skipped = next_page.result()
+                if not page_ids:
+                    break
+                offset += len(page_ids)
+                next_page = reader.submit(_fetch_page, collection, offset)
+                sample_id = sample_id or page_ids[0]
+                skipped += page_skipped
+                
+                # Concept extraction and scoring are pure CPU work: spread them across
+                # worker processes, streaming results back in input order
+                fields = executor.map(
+                    _compute_fields,
+                    [doc for _, doc, _ in todo],
+                    [meta for _, _, meta in todo],
+                    chunksize=COMPUTE_CHUNK_SIZE,
+                )
+                for (memory_id, _, meta), (concepts, surfaces_when, authority_score) in zip(todo, fields):
+                    # Queue the updated metadata for the next batched ChromaDB update
+                    pending_ids.append(memory_id)
+                    pending_metas.append({
+                        **meta,
+                        "concepts": concepts,
+                        "surfaces_when": surfaces_when,
+                        "authority_score": authority_score,
+                    })
+                    if len(pending_ids) >= BATCH_SIZE:
+                        flush()
+                    
+                    updated += 1
+                    
+                    if updated % 10 == 0:
+                        print(f"   [{updated + skipped}/{total}] Processed...")
         
-        if (i + 1) % 10 == 0:
-            print(f"   [{i + 1}/{total}] Processed...")
+        flush()
+        # Surface any write error before reporting success
+        while writes:
+            writes.popleft().result()
+    finally:
+        reader.shutdown(wait=True)
+        writer.shutdown(wait=True)
     
     print(f"\n[OK] Migration complete!")
     print(f"   Updated: {updated}")
@@ -111,7 +251,9 @@ async def migrate_v4():
     
     # Show sample
     print("\n[*] Sample migrated memory:")
-    sample = collection.get(ids=[all_memories["ids"][0]], include=["metadatas"])
+    if sample_id is None:
+        return
+    sample = collection.get(ids=[sample_id], include=["metadatas"])
     if sample["metadatas"]:
         meta = sample["metadatas"][0]
         print(f"   concepts: {meta.get('concepts')}")
@@ -120,4 +262,4 @@ async def migrate_v4():
 
 
 if __name__ == "__main__":
-    asyncio.run(migrate_v4())
+    migrate_v4()
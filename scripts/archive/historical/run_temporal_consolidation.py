@@ -5,6 +5,7 @@ Archives low-strength memories based on temporal decay.
 """
 
 import asyncio
+import signal
 import sys
 from pathlib import Path
 
@@ -23,9 +24,11 @@ async def main():
     
     consolidator = get_temporal_consolidator()
     
-    # Get current stats
-    print("1. Analyzing current memory strength distribution...")
-    stats = await consolidator.get_consolidation_stats()
+    # One scan yields both the strength distribution and the archive pass;
+    # nothing is archived unless there are candidates below the threshold
+    print("1. Analyzing memory strength and running consolidation...")
+    result = await consolidator.consolidate_weak_memories(return_stats=True)
+    stats = result["stats"]
     
     print(f"\nCurrent Statistics:")
     print(f"  Total memories analyzed: {stats['total_memories']}")
@@ -39,10 +42,6 @@ async def main():
         print("\n[OK] No memories need archiving at this time.")
         return
     
-    # Run consolidation
-    print(f"\n2. Running consolidation process...")
-    result = await consolidator.consolidate_weak_memories()
-    
     print(f"\nConsolidation Results:")
     print(f"  Memories scanned: {result['scanned']}")
     print(f"  Weak memories found: {result['weak_found']}")
@@ -59,6 +58,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    # SIGTERM (docker stop, systemd) takes the same path as Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
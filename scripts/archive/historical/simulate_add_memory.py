@@ -1,12 +1,7 @@
 import asyncio
-import os
-import sys
+import signal
 
-# Add project root to path
-sys.path.append(os.getcwd())
-
-from src.mcp.server import ElefanteMCPServer
-from src.core.graph_store import GraphStore
+from _common import get_server
 
 async def simulate_add_memory():
     print(" SIMULATING ADD MEMORY (Debugging Lock/Crash)")
@@ -15,7 +10,7 @@ async def simulate_add_memory():
     # 1. Initialize Server (which initializes GraphStore)
     print("1. Initializing MCP Server...")
     try:
-        server = ElefanteMCPServer()
+        server = get_server()
         # Manually initialize graph store to check for locks/errors immediately
         print("   - accessible attributes:", dir(server))
         # Accessing private attr for debug, assuming it exists or is internal
@@ -55,6 +50,8 @@ async def simulate_add_memory():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    # SIGTERM (docker stop, systemd) takes the same path as Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
     try:
         asyncio.run(simulate_add_memory())
     except KeyboardInterrupt:
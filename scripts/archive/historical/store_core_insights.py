@@ -158,15 +158,19 @@ ENFORCEMENT: These preferences stored in Elefante must be APPLIED (Layer 4) and
     
     print("Storing core insights into Elefante...\n")
     
-    for i, insight in enumerate(insights, 1):
-        result = await orchestrator.add_memory(
-            content=insight["content"],
-            memory_type="insight",  # Valid MemoryType from enum
-            tags=insight["tags"],
-            importance=insight["importance"],
-            metadata={"space": insight["space"]}
-        )
-        
+    # Bulk add: all insight contents are embedded in one batch
+    results = await orchestrator.add_memories([
+        {
+            "content": insight["content"],
+            "memory_type": "insight",  # Valid MemoryType from enum
+            "tags": insight["tags"],
+            "importance": insight["importance"],
+            "metadata": {"space": insight["space"]},
+        }
+        for insight in insights
+    ])
+    
+    for i, (insight, result) in enumerate(zip(insights, results), 1):
         if result:
             print(f"Insight {i}/4 stored: {result.id}")
             print(f"   Tags: {', '.join(insight['tags'])}")
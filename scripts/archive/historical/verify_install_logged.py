@@ -1,18 +1,27 @@
 import sys
 import subprocess
 import os
-from datetime import datetime
+import time
 
 LOG_FILE = "docs/archive/historical/2025-12-06-implementation-log.md"
 
-def log(message):
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    entry = f"\n- **{timestamp}**: {message}"
-    print(message)
-    with open(LOG_FILE, "a") as f:
-        f.write(entry)
+_FMT = "%H:%M:%S"
+
+def _ts():
+    # Whole-second wall clock; no datetime object per log line
+    return time.strftime(_FMT, time.localtime(time.time_ns() // 1_000_000_000))
 
 def check_install():
+    # One handle for the whole run; buffered writes instead of an open per line
+    with open(LOG_FILE, "a", buffering=8192) as fh:
+
+        def log(message):
+            fh.write(f"\n- **{_ts()}**: {message}")
+            print(message)
+
+        _check_install(fh, log)
+
+def _check_install(fh, log):
     log("Verifying Critical Dependencies...")
     
     python_exec = sys.executable
@@ -31,8 +40,17 @@ def check_install():
             
     if missing:
         log(f" Missing packages: {', '.join(missing)}. Attempting FORCE install...")
+        # Entries so far reach the file before pip starts writing output
+        fh.flush()
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing)
+            # pip stays out of process (in-process use is unsupported, and the
+            # checks above already imported some of these packages); wheels are
+            # preferred so kuzu/chromadb never fall back to source builds
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install",
+                "-q", "--disable-pip-version-check", "--prefer-binary",
+                *missing,
+            ])
             log(" Force install completed.")
         except Exception as e:
             log(f" Force install failed: {e}")
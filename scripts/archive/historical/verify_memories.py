@@ -22,23 +22,18 @@ async def verify_memories():
         "Privacy Requirements local-first"
     ]
     
-    all_results = []
-    for query in queries:
-        results = await orchestrator.search_memories(
-            query=query,
-            mode=QueryMode.HYBRID,
-            limit=2
-        )
-        if results:
-            all_results.extend(results)
+    # Searches are independent, so run them concurrently
+    batches = await asyncio.gather(*(
+        orchestrator.search_memories(query=query, mode=QueryMode.HYBRID, limit=2)
+        for query in queries
+    ))
     
-    # Remove duplicates by memory_id
-    seen_ids = set()
-    unique_results = []
-    for result in all_results:
-        if result.memory.id not in seen_ids:
-            seen_ids.add(result.memory.id)
-            unique_results.append(result)
+    # Remove duplicates by memory_id in one pass (first hit wins, order kept)
+    unique = {}
+    for batch in batches:
+        for result in batch:
+            unique.setdefault(result.memory.id, result)
+    unique_results = list(unique.values())
     
     print(f"\nFound {len(unique_results)} unique memories:\n")
     
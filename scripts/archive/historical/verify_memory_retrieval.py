@@ -1,17 +1,12 @@
 import asyncio
-import os
-import sys
 
-# Add project root to path
-sys.path.append(os.getcwd())
-
-from src.mcp.server import ElefanteMCPServer
+from _common import get_server
 
 async def list_recent_memories():
     print(" VERIFYING MEMORY ADDITION")
     print("----------------------------")
     
-    server = ElefanteMCPServer()
+    server = get_server()
     
     # We want to check if the memory we just added is there.
     # The simulated memory had content: "The user prefers to use 'safe_mode'..."
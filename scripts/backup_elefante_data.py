@@ -6,19 +6,263 @@ Creates a timestamped zip archive under ~/.elefante/backups.
 
 Safe to run with Elefante Mode OFF.
 
+Lock files (*.lock) are left out of every backup, full or incremental: a
+restored lock would make the store look held by a process that is gone.
+Kuzu *.wal files are kept, as they hold committed data not yet checkpointed.
+
 Usage:
   python scripts/backup_elefante_data.py
   python scripts/backup_elefante_data.py --elefante-home ~/.elefante
   python scripts/backup_elefante_data.py --out-dir ~/.elefante/backups
+  python scripts/backup_elefante_data.py --jobs 4
+  python scripts/backup_elefante_data.py --incremental
+  python scripts/backup_elefante_data.py --incremental --base ~/.elefante/backups/elefante_data_backup_YYYYMMDD_HHMMSS.zip
+
+Incremental backups store only files whose size or mtime changed since the
+base archive, plus a MANIFEST.json naming the archive that holds each
+unchanged file. Keep the base (and any earlier archives it refers to) next
+to the delta; restore_elefante_data.py reassembles the full tree.
 """
 
 from __future__ import annotations
 
 import argparse
+import io
+import json
+import os
 import shutil
+import struct
+import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# python-isal is optional: a drop-in zlib with SIMD deflate and CRC32.
+# It only accepts levels 0-3, so the level follows the backend.
+try:
+    from isal import isal_zlib as _zlib
+
+    COMPRESS_LEVEL = _zlib.ISAL_DEFAULT_COMPRESSION
+except ImportError:
+    import zlib as _zlib
+
+    COMPRESS_LEVEL = 6
+
+# Read size per file chunk; also the in-memory limit of each spooled stream
+CHUNK_SIZE = 1 << 20
+
+# Transient lock files are not data; a restored copy would look held
+SKIP_SUFFIXES = (".lock",)
+
+# Incremental archives: arcname -> {"archive", "date_time", "size"} for every
+# file carried over from an earlier archive
+MANIFEST_NAME = "MANIFEST.json"
+
+
+def _find_latest_backup(backup_dir: Path) -> Path | None:
+    backups = sorted(backup_dir.glob("elefante_data_backup_*.zip"))
+    return backups[-1] if backups else None
+
+
+def _zip_date_time(mtime: float) -> list[int]:
+    """An mtime as a zip entry stores it (local time, even seconds)."""
+    date_time = list(time.localtime(mtime)[:6])
+    if date_time[0] < 1980:
+        return [1980, 1, 1, 0, 0, 0]
+    date_time[5] -= date_time[5] % 2
+    return date_time
+
+
+def _load_baseline(base_path: Path) -> dict:
+    """Map arcname -> where its bytes live, for every file the base archive restores."""
+    baseline = {}
+    with zipfile.ZipFile(base_path) as bz:
+        if MANIFEST_NAME in bz.NameToInfo:
+            # The base is itself a delta: its carried-over files stay where they are
+            baseline.update(json.loads(bz.read(MANIFEST_NAME))["unchanged"])
+        for zinfo in bz.infolist():
+            if zinfo.is_dir() or zinfo.filename == MANIFEST_NAME:
+                continue
+            baseline[zinfo.filename] = {
+                "archive": base_path.name,
+                "date_time": list(zinfo.date_time),
+                "size": zinfo.file_size,
+            }
+    return baseline
+
+
+def _deflate(zinfo: zipfile.ZipInfo, chunks, stream):
+    """Raw-deflate chunks into stream; fill in the entry's CRC and sizes."""
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    compressor = _zlib.compressobj(COMPRESS_LEVEL, _zlib.DEFLATED, -15)
+    crc = size = 0
+    for chunk in chunks:
+        crc = _zlib.crc32(chunk, crc)
+        size += len(chunk)
+        stream.write(compressor.compress(chunk))
+    stream.write(compressor.flush())
+    zinfo.CRC, zinfo.file_size, zinfo.compress_size = crc, size, stream.tell()
+    stream.seek(0)
+    return zinfo, stream
+
+
+def _deflate_file(path: str, arcname: str):
+    """Read and raw-deflate one file; return its ZipInfo and the deflated stream."""
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    # Large compressed entries spill to disk instead of piling up in memory
+    stream = tempfile.SpooledTemporaryFile(max_size=CHUNK_SIZE)
+    with open(path, "rb") as src:
+        return _deflate(zinfo, iter(lambda: src.read(CHUNK_SIZE), b""), stream)
+
+
+# Zip format (APPNOTE.TXT) records; a 0xFFFFFFFF size or offset defers to Zip64.
+# Like zipfile, Zip64 is used from 2 GiB on, as some readers treat fields as signed.
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_END_RECORD = struct.Struct("<IHHHHIIH")
+_ZIP64_END_RECORD = struct.Struct("<IQHHIIQQQQ")
+_ZIP64_LOCATOR = struct.Struct("<IIQI")
+_ZIP64_MAX = 0xFFFFFFFF
+_ZIP64_LIMIT = (1 << 31) - 1
+
+
+class _ZipWriter:
+    """Frame entries deflated ahead of time into a zip archive.
+
+    ZipFile can only write entries it compresses itself, so the headers
+    and central directory for the workers' output are written here from
+    the format spec. Zip64 records are added only where a size, offset or
+    entry count needs them.
+    """
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._entries = []
+
+    def append(self, zinfo: zipfile.ZipInfo, stream=None) -> None:
+        """Write one entry; stream holds its deflated data (None for a directory)."""
+        if stream is None:
+            zinfo.CRC = zinfo.file_size = zinfo.compress_size = 0
+        offset = self._fp.tell()
+        name = zinfo.filename.encode("utf-8")
+        flags = 0 if zinfo.filename.isascii() else 0x800
+        zip64 = max(zinfo.file_size, zinfo.compress_size) > _ZIP64_LIMIT
+        extra = struct.pack("<HHQQ", 1, 16, zinfo.file_size, zinfo.compress_size) if zip64 else b""
+        self._fp.write(_LOCAL_HEADER.pack(
+            0x04034B50, 45 if zip64 else 20, flags, zinfo.compress_type, *_dos_date_time(zinfo),
+            zinfo.CRC,
+            _ZIP64_MAX if zip64 else zinfo.compress_size,
+            _ZIP64_MAX if zip64 else zinfo.file_size,
+            len(name), len(extra),
+        ))
+        self._fp.write(name + extra)
+        if stream is not None:
+            with stream:
+                shutil.copyfileobj(stream, self._fp, CHUNK_SIZE)
+        self._entries.append((zinfo, name, flags, offset))
+
+    def close(self) -> None:
+        """Write the central directory and end records."""
+        start = self._fp.tell()
+        for zinfo, name, flags, offset in self._entries:
+            fields = []
+            sizes64 = max(zinfo.file_size, zinfo.compress_size) > _ZIP64_LIMIT
+            offset64 = offset > _ZIP64_LIMIT
+            if sizes64:
+                fields += [zinfo.file_size, zinfo.compress_size]
+            if offset64:
+                fields.append(offset)
+            extra = struct.pack(f"<HH{len(fields)}Q", 1, 8 * len(fields), *fields) if fields else b""
+            version = 45 if fields else 20
+            self._fp.write(_CENTRAL_HEADER.pack(
+                0x02014B50, zinfo.create_system << 8 | version, version, flags,
+                zinfo.compress_type, *_dos_date_time(zinfo), zinfo.CRC,
+                _ZIP64_MAX if sizes64 else zinfo.compress_size,
+                _ZIP64_MAX if sizes64 else zinfo.file_size,
+                len(name), len(extra), 0, 0, 0, zinfo.external_attr,
+                _ZIP64_MAX if offset64 else offset,
+            ))
+            self._fp.write(name + extra)
+        end = self._fp.tell()
+
+        count, size = len(self._entries), end - start
+        zip64 = count >= 0xFFFF or size > _ZIP64_LIMIT or start > _ZIP64_LIMIT
+        if zip64:
+            self._fp.write(_ZIP64_END_RECORD.pack(
+                0x06064B50, _ZIP64_END_RECORD.size - 12, 45, 45, 0, 0, count, count, size, start
+            ))
+            self._fp.write(_ZIP64_LOCATOR.pack(0x07064B50, 0, end, 1))
+        self._fp.write(_END_RECORD.pack(
+            0x06054B50, 0, 0, min(count, 0xFFFF), min(count, 0xFFFF),
+            _ZIP64_MAX if zip64 else size, _ZIP64_MAX if zip64 else start, 0,
+        ))
+
+
+def _dos_date_time(zinfo: zipfile.ZipInfo) -> tuple[int, int]:
+    """The packed MS-DOS (time, date) fields for an entry's date_time."""
+    year, month, day, hour, minute, second = zinfo.date_time
+    return hour << 11 | minute << 5 | second // 2, (year - 1980) << 9 | month << 5 | day
+
+
+def _write_archive(data_dir: Path, archive_path: Path, jobs: int, baseline: dict | None = None) -> int:
+    """Deflate every file under data_dir into archive_path, relative to data_dir.
+
+    Worker threads read and compress files in parallel (zlib and isal
+    release the GIL); this thread appends the results in walk order.
+    With a baseline, files whose size and mtime match it are listed in
+    MANIFEST.json instead of being stored again. Returns the number of
+    files stored.
+    """
+    with open(archive_path, "wb") as fp:
+        writer = _ZipWriter(fp)
+        files = []
+        unchanged = {}
+        for dirpath, dirnames, filenames in os.walk(data_dir):
+            arcdir = os.path.relpath(dirpath, data_dir)
+            # Directory entries keep empty store directories on restore
+            for name in sorted(dirnames):
+                writer.append(zipfile.ZipInfo.from_file(
+                    os.path.join(dirpath, name), os.path.normpath(os.path.join(arcdir, name))
+                ))
+            for name in sorted(filenames):
+                if name.endswith(SKIP_SUFFIXES):
+                    continue
+                path = os.path.join(dirpath, name)
+                arcname = os.path.normpath(os.path.join(arcdir, name))
+                if baseline is not None:
+                    key = arcname.replace(os.sep, "/")
+                    prior = baseline.get(key)
+                    st = os.stat(path)
+                    if (
+                        prior is not None
+                        and prior["size"] == st.st_size
+                        and prior["date_time"] == _zip_date_time(st.st_mtime)
+                    ):
+                        unchanged[key] = prior
+                        continue
+                files.append((path, arcname))
+
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="deflate") as executor:
+            # Bounded look-ahead: at most 2 * jobs finished streams wait for the writer
+            pending = deque()
+            for path, arcname in files:
+                if len(pending) >= 2 * jobs:
+                    writer.append(*pending.popleft().result())
+                pending.append(executor.submit(_deflate_file, path, arcname))
+            while pending:
+                writer.append(*pending.popleft().result())
+
+        if baseline is not None:
+            manifest = zipfile.ZipInfo(MANIFEST_NAME, date_time=time.localtime()[:6])
+            manifest.external_attr = 0o600 << 16
+            payload = json.dumps({"unchanged": unchanged}, indent=1).encode()
+            writer.append(*_deflate(manifest, [payload], io.BytesIO()))
+        writer.close()
+    return len(files)
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Backup Elefante data directory")
@@ -34,7 +278,28 @@ def main() -> int:
         default=None,
         help="Output directory for backups (default: <elefante-home>/backups)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Files compressed in parallel (default: CPU count)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Store only files changed since the base archive (see --base)",
+    )
+    parser.add_argument(
+        "--base",
+        type=str,
+        default=None,
+        help="Base archive for --incremental (default: latest backup in --out-dir)",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.base and not args.incremental:
+        parser.error("--base requires --incremental")
 
     elefante_home = Path(args.elefante_home).expanduser().resolve()
     data_dir = elefante_home / "data"
@@ -47,8 +312,19 @@ def main() -> int:
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     base_name = out_dir / f"elefante_data_backup_{stamp}"
 
-    archive_path = shutil.make_archive(str(base_name), "zip", root_dir=str(data_dir))
-    print(f"[ok] backup created: {archive_path}")
+    baseline = None
+    if args.incremental:
+        base_path = Path(args.base).expanduser().resolve() if args.base else _find_latest_backup(out_dir)
+        if base_path is None or not base_path.exists():
+            raise SystemExit("[error] no base archive for --incremental; run a full backup first")
+        if base_path.parent != out_dir:
+            raise SystemExit(f"[error] base archive must be in the output dir: {out_dir}")
+        baseline = _load_baseline(base_path)
+        print(f"[info] incremental against: {base_path.name}")
+
+    archive_path = base_name.with_name(base_name.name + ".zip")
+    stored = _write_archive(data_dir, archive_path, args.jobs, baseline)
+    print(f"[ok] backup created: {archive_path} ({stored} files stored)")
     return 0
 
 
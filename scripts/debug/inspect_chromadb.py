@@ -23,8 +23,20 @@ def inspect_chromadb():
     print("=" * 80)
     
     try:
-        conn = sqlite3.connect(str(db_path))
+        # Read-only URI: no write locks against a live Chroma instance. Not
+        # immutable=1, since the MCP server may still be writing to the file.
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True, isolation_level=None)
         cursor = conn.cursor()
+
+        # Inspection only reads: forbid writes, keep temp data in memory and
+        # let SQLite mmap pages instead of copying them through the page cache
+        for pragma in (
+            "query_only=1",
+            "temp_store=MEMORY",
+            "mmap_size=268435456",
+            "cache_size=-65536",
+        ):
+            cursor.execute(f"PRAGMA {pragma};")
         
         # Get all tables
         print("\n[TABLES] TABLES IN DATABASE:")
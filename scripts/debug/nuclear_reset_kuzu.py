@@ -6,7 +6,6 @@ Backs up and removes corrupted kuzu_db file, allowing fresh initialization.
 """
 
 import sys
-import shutil
 from pathlib import Path
 from datetime import datetime
 import argparse
@@ -62,23 +61,15 @@ def nuclear_reset_kuzu(*, apply: bool, confirm: str):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = data_dir / f"kuzu_db.corrupted.{timestamp}.backup"
         
-        print(f"[1/2] Creating backup...")
+        # The backup sits next to the original, so a rename both backs it up
+        # and clears the path without copying the database bytes
+        print(f"[1/1] Moving corrupted file to backup...")
         print(f"      From: {kuzu_path}")
         print(f"      To:   {backup_path}")
         
         try:
-            shutil.copy2(kuzu_path, backup_path)
-            print(f"      [OK] Backup created successfully")
-        except Exception as e:
-            print(f"      [FAIL] Backup failed: {e}")
-            return False
-        
-        print()
-        print(f"[2/2] Removing corrupted file...")
-        
-        try:
-            kuzu_path.unlink()
-            print(f"      [OK] Corrupted file removed")
+            kuzu_path.rename(backup_path)
+            print(f"      [OK] Backup created, corrupted file removed")
             print()
             print("=" * 70)
             print("SUCCESS: Kuzu database reset complete")
@@ -91,7 +82,7 @@ def nuclear_reset_kuzu(*, apply: bool, confirm: str):
             return True
             
         except Exception as e:
-            print(f"      [FAIL] Removal failed: {e}")
+            print(f"      [FAIL] Move failed: {e}")
             print()
             print("Manual intervention required:")
             print(f"  del \"{kuzu_path}\"")
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 import argparse
 import os
-import subprocess
+import signal
 import sys
-import time
 from pathlib import Path
 
 
@@ -17,37 +16,60 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-def _default_db_paths() -> list[Path]:
-    paths: list[Path] = []
+def _db_path() -> Path:
+    """The one Kuzu database path Elefante opens (configured, else the default)."""
+    sys.path.insert(0, str(_repo_root()))
+    from src.utils.config import DATA_DIR  # type: ignore
 
-    # Prefer configured database path.
     try:
-        sys.path.insert(0, str(_repo_root()))
         from src.utils.config import get_config  # type: ignore
 
-        cfg = get_config()
-        paths.append(Path(cfg.elefante.graph_store.database_path))
+        return Path(get_config().elefante.graph_store.database_path)
     except Exception:
-        pass
+        return DATA_DIR / "kuzu_db"
 
-    # Common defaults.
-    paths.append(Path.home() / ".elefante" / "data" / "kuzu_db")
-    paths.append(Path("kuzu_db").resolve())
 
-    # De-dupe while preserving order.
-    seen: set[str] = set()
-    uniq: list[Path] = []
-    for p in paths:
-        key = str(p)
-        if key in seen:
-            continue
-        seen.add(key)
-        uniq.append(p)
-    return uniq
+def _stop_mcp_server(timeout: float = 2.0) -> bool:
+    """SIGTERM the MCP server and wait for it to exit; True once nothing holds the DB."""
+    sys.path.insert(0, str(_repo_root()))
+    from scripts.restart_elefante import _wait_pid_exit, find_mcp_server_process  # type: ignore
+
+    pid = find_mcp_server_process()
+    if pid is None:
+        print("No src.mcp.server process found.")
+        return True
+
+    print(f"Stopping Elefante MCP server (PID {pid})...")
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return True
+    except PermissionError as e:
+        print(f"Error stopping PID {pid}: {e}")
+        return False
+
+    # Returns as soon as the process is gone instead of a fixed sleep
+    if not _wait_pid_exit(pid, timeout):
+        print(f"PID {pid} did not exit within {timeout:.0f}s.")
+        return False
+    print(f"PID {pid} exited.")
+    return True
+
+
+def check_database(db_path: Path) -> bool:
+    """Report whether the database path has the single-file layout Kuzu 0.11+ opens."""
+    if not db_path.exists():
+        print(f"Database not found: {db_path}")
+        return True
+    if db_path.is_file():
+        print(f"Database OK (single-file layout): {db_path}")
+        return True
+    print(f"Database is a directory (pre-0.11 layout or corrupted): {db_path}")
+    return False
 
 
 def unlock_database(*, apply: bool, confirm: str, kill: bool) -> bool:
-    """Attempt to unlock the Kuzu database (safe-by-default).
+    """Attempt to unlock the configured Kuzu database (safe-by-default).
 
     Default is dry-run. To actually kill processes / delete lock files you must provide:
     - environment: ELEFANTE_PRIVILEGED=1
@@ -57,26 +79,21 @@ def unlock_database(*, apply: bool, confirm: str, kill: bool) -> bool:
     print("KUZU DATABASE UNLOCKER")
     print("----------------------")
 
-    db_paths = _default_db_paths()
-    lock_files = [p / ".lock" for p in db_paths]
+    db_path = _db_path()
+    lock_file = db_path / ".lock"
 
-    print("DB paths checked:")
-    for p in db_paths:
-        print(f"- {p}")
+    print(f"DB path: {db_path}")
 
-    found = [lf for lf in lock_files if lf.exists()]
-    if not found:
-        print("No lock file found in known locations.")
+    if not lock_file.exists():
+        print("No lock file found.")
         return True
 
-    print("Lock files found:")
-    for lf in found:
-        print(f"- {lf}")
+    print(f"Lock file found: {lock_file}")
 
     if not apply:
         print("Dry-run only.")
         print("Re-run with: ELEFANTE_PRIVILEGED=1 --apply --confirm DELETE")
-        print("Optional: add --kill to attempt stopping src.mcp.server processes.")
+        print("Optional: add --kill to stop the src.mcp.server process first.")
         return True
 
     if not _truthy_env("ELEFANTE_PRIVILEGED"):
@@ -86,43 +103,34 @@ def unlock_database(*, apply: bool, confirm: str, kill: bool) -> bool:
         print("Refusing to apply: pass --confirm DELETE")
         return False
 
-    if kill:
-        print("Attempting to stop Elefante MCP server processes (best-effort)...")
-        try:
-            subprocess.run(["pkill", "-f", "src.mcp.server"], check=False)
-            print("Kill signal sent to src.mcp.server processes (if any).")
-        except FileNotFoundError:
-            print("pkill not found; skipping process kill.")
-        except Exception as e:
-            print(f"Error killing processes: {e}")
-
-        # Wait briefly for OS to release handles.
-        time.sleep(1)
-
-    lock_removed = False
-    for lf in found:
-        try:
-            lf.unlink()
-            print(f"Removed: {lf}")
-            lock_removed = True
-        except Exception as e:
-            print(f"Failed to remove {lf}: {e}")
-
-    if lock_removed:
-        print("Database lock file(s) removed.")
+    if kill and not _stop_mcp_server():
+        print("MCP server still running; leaving the lock in place.")
+        return False
+
+    try:
+        os.unlink(lock_file)
+    except FileNotFoundError:
+        print("Lock file already gone.")
         return True
+    except OSError as e:
+        print(f"Failed to remove {lock_file}: {e}")
+        return False
 
-    print("No lock files could be removed.")
-    return False
+    print(f"Removed: {lock_file}")
+    return True
 
 
 def main() -> int:
     p = argparse.ArgumentParser(description="Unlock Kuzu database (dry-run by default)")
-    p.add_argument("--apply", action="store_true", help="Actually remove lock file(s)")
+    p.add_argument("--apply", action="store_true", help="Actually remove the lock file")
     p.add_argument("--confirm", type=str, default="", help="Must be exactly 'DELETE' to apply")
-    p.add_argument("--kill", action="store_true", help="Also attempt to stop src.mcp.server processes")
+    p.add_argument("--kill", action="store_true", help="Also stop the src.mcp.server process first (SIGTERM, waits up to 2s)")
+    p.add_argument("--check", action="store_true", help="Only check the database path layout and exit")
     args = p.parse_args()
 
+    if args.check:
+        return 0 if check_database(_db_path()) else 1
+
     ok = unlock_database(apply=bool(args.apply), confirm=str(args.confirm), kill=bool(args.kill))
     return 0 if ok else 1
 
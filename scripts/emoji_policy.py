@@ -23,6 +23,7 @@ from __future__ import annotations
 import argparse
 import sys
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -101,12 +102,19 @@ def iter_repo_files(root: Path) -> list[Path]:
 
 def find_violations_in_text(text: str, path: Path) -> list[Violation]:
     violations: list[Violation] = []
+    # Matches arrive in order, so line/column are tracked forward from the
+    # previous match: each character is scanned for newlines once per file
+    line = 1
+    line_start = 0
+    pos = 0
     for match in VIOLATION_RE.finditer(text):
         idx = match.start()
-        line = text.count("\n", 0, idx) + 1
-        last_newline = text.rfind("\n", 0, idx)
-        col = idx + 1 if last_newline == -1 else (idx - last_newline)
-        violations.append(Violation(path=path, line=line, col=col, char=match.group(0)))
+        newlines = text.count("\n", pos, idx)
+        if newlines:
+            line += newlines
+            line_start = text.rfind("\n", pos, idx) + 1
+        pos = idx
+        violations.append(Violation(path=path, line=line, col=idx - line_start + 1, char=match.group(0)))
     return violations
 
 
@@ -130,14 +138,37 @@ def strip_violations(text: str) -> str:
     return VIOLATION_RE.sub("", text)
 
 
+# Files per worker round trip; most files are small and clean
+SCAN_CHUNKSIZE = 32
+
+
+def _scan_one(path: Path) -> list[Violation]:
+    """Read and scan one file (module level so process pool workers can run it)."""
+    text = read_text_utf8(path)
+    if text is None:
+        return []
+    return find_violations_in_text(text, path)
+
+
+def _clean_one(path: Path) -> tuple[Path, str | None, int]:
+    """Strip violations from one file; the text is None when nothing changes."""
+    text = read_text_utf8(path)
+    if text is None or VIOLATION_RE.search(text) is None:
+        return path, None, 0
+
+    cleaned = strip_violations(text)
+    if cleaned == text:
+        return path, None, 0
+    return path, cleaned, len(text) - len(cleaned)
+
+
 def cmd_check(root: Path, max_report: int) -> int:
     all_violations: list[Violation] = []
 
-    for path in iter_repo_files(root):
-        text = read_text_utf8(path)
-        if text is None:
-            continue
-        all_violations.extend(find_violations_in_text(text, path))
+    # Files are independent: scan them across cores; map keeps file order
+    with ProcessPoolExecutor() as executor:
+        for violations in executor.map(_scan_one, iter_repo_files(root), chunksize=SCAN_CHUNKSIZE):
+            all_violations.extend(violations)
 
     if not all_violations:
         print("OK: no emoji violations found")
@@ -158,22 +189,14 @@ def cmd_apply(root: Path) -> int:
     changed_files = 0
     removed_chars_total = 0
 
-    for path in iter_repo_files(root):
-        text = read_text_utf8(path)
-        if text is None:
-            continue
-
-        matches = list(VIOLATION_RE.finditer(text))
-        if not matches:
-            continue
-
-        cleaned = strip_violations(text)
-        if cleaned == text:
-            continue
-
-        removed_chars_total += (len(text) - len(cleaned))
-        write_text_utf8(path, cleaned)
-        changed_files += 1
+    # Workers only read and clean; this process does every write
+    with ProcessPoolExecutor() as executor:
+        for path, cleaned, removed in executor.map(_clean_one, iter_repo_files(root), chunksize=SCAN_CHUNKSIZE):
+            if cleaned is None:
+                continue
+            removed_chars_total += removed
+            write_text_utf8(path, cleaned)
+            changed_files += 1
 
     print(f"APPLIED: updated {changed_files} files; removed {removed_chars_total} characters")
     return 0
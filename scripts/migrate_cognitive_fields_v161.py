@@ -148,16 +148,20 @@ def main():
     errors = 0
     
     for offset in range(0, total, batch_size):
+        # migrate_memory() only reads metadata; document bodies and
+        # embeddings dominate the transfer and are never used
         result = collection.get(
             limit=batch_size,
             offset=offset,
-            include=["metadatas", "documents", "embeddings"]
+            include=["metadatas"]
         )
         
         ids = result.get("ids", [])
         metadatas = result.get("metadatas", [])
-        documents = result.get("documents", [])
-        embeddings = result.get("embeddings", [])
+        
+        # Changed rows of this batch go to ChromaDB in one update call
+        pending_ids = []
+        pending_meta = []
         
         for i, memory_id in enumerate(ids):
             metadata = metadatas[i] if i < len(metadatas) else {}
@@ -173,18 +177,23 @@ def main():
                         new_display = str(diff["new"])[:50]
                         print(f"    {field}: {old_display} -> {new_display}")
                     
-                    # Apply update to ChromaDB (metadata only - don't touch embeddings)
-                    if not args.dry_run:
-                        collection.update(
-                            ids=[memory_id],
-                            metadatas=[metadata],
-                        )
+                    pending_ids.append(memory_id)
+                    pending_meta.append(metadata)
                 else:
                     unchanged += 1
                     
             except Exception as e:
                 errors += 1
                 print(f"ERROR [{memory_id[:8]}]: {e}")
+        
+        # Apply updates to ChromaDB (metadata only - don't touch embeddings)
+        if not args.dry_run and pending_ids:
+            try:
+                collection.update(ids=pending_ids, metadatas=pending_meta)
+            except Exception as e:
+                migrated -= len(pending_ids)
+                errors += len(pending_ids)
+                print(f"ERROR [batch at offset {offset}, {len(pending_ids)} memories]: {e}")
     
     # Summary
     print(f"\n=== Migration Summary ===")
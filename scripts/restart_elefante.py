@@ -14,6 +14,7 @@ Notes:
 import os
 import sys
 import time
+import select
 import signal
 import subprocess
 import argparse
@@ -29,14 +30,42 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# A whole NUL-delimited argv element, as in ``python -m src.mcp.server``; shell
+# wrappers that merely mention the module inside a longer argument do not match
+_TARGET = b"\0src.mcp.server\0"
+
+
+def _find_pid_linux():
+    """Scan /proc cmdlines for the MCP server; no subprocess needed."""
+    own_pid = os.getpid()
+    with os.scandir("/proc") as it:
+        for entry in it:
+            if not entry.name.isdigit() or int(entry.name) == own_pid:
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    cmdline = f.read(4096)
+            except OSError:
+                # Exited mid-scan or not readable
+                continue
+            if _TARGET in cmdline:
+                return int(entry.name)
+    return None
+
+
 def find_mcp_server_process():
     """Find the running MCP server process."""
     try:
-        result = subprocess.run(["ps", "aux"], capture_output=True, text=True, check=True)
-        for line in result.stdout.split("\n"):
-            if "python" in line and "src.mcp.server" in line and "grep" not in line:
-                parts = line.split()
-                pid = int(parts[1])
+        if sys.platform.startswith("linux"):
+            return _find_pid_linux()
+
+        # pgrep does the matching and prints bare PIDs (exit 1 = no match)
+        result = subprocess.run(
+            ["pgrep", "-f", "python.*src\\.mcp\\.server"], capture_output=True, text=True
+        )
+        for line in result.stdout.split():
+            pid = int(line)
+            if pid != os.getpid():
                 return pid
         return None
     except Exception as e:
@@ -49,68 +78,111 @@ def clean_locks():
     from src.utils.config import ELEFANTE_HOME
 
     lock_dir = ELEFANTE_HOME / "locks"
-    if not lock_dir.exists():
+
+    # One directory pass; DirEntry carries the type from readdir, so no
+    # separate exists()/stat per lock
+    try:
+        with os.scandir(lock_dir) as it:
+            lock_files = [entry for entry in it if entry.name.endswith(".lock") and entry.is_file()]
+    except FileNotFoundError:
         logger.info("No lock directory found")
         return
 
-    lock_files = list(lock_dir.glob("*.lock"))
-
     if not lock_files:
         logger.info("No lock files to clean")
         return
 
+    # Linux: one /proc listing answers every liveness check below; elsewhere
+    # each lock falls back to kill(pid, 0)
+    live_pids = None
+    if sys.platform.startswith("linux"):
+        live_pids = {int(name) for name in os.listdir("/proc") if name.isdigit()}
+
     for lock_file in lock_files:
         try:
-            if lock_file.exists():
-                content = lock_file.read_text().strip()
-
-                if not content:
-                    lock_file.unlink()
-                    logger.info(f"Removed empty lock: {lock_file.name}")
-                    continue
-
-                parts = content.split("|")
-                if len(parts) >= 1:
-                    try:
-                        pid = int(parts[0])
+            # PID|timestamp payload is a few bytes: one open + read
+            fd = os.open(lock_file.path, os.O_RDONLY)
+            try:
+                content = os.read(fd, 64).decode().strip()
+            finally:
+                os.close(fd)
+
+            if not content:
+                os.unlink(lock_file.path)
+                logger.info(f"Removed empty lock: {lock_file.name}")
+                continue
+
+            parts = content.split("|")
+            if len(parts) >= 1:
+                try:
+                    pid = int(parts[0])
+                    if live_pids is None:
                         os.kill(pid, 0)
-                        logger.warning(f"Lock {lock_file.name} held by live PID {pid} - keeping")
-                    except (ValueError, ProcessLookupError, PermissionError):
-                        lock_file.unlink()
-                        logger.info(f"Removed stale lock: {lock_file.name} (dead PID)")
+                    elif pid not in live_pids:
+                        raise ProcessLookupError(pid)
+                    logger.warning(f"Lock {lock_file.name} held by live PID {pid} - keeping")
+                except (ValueError, ProcessLookupError, PermissionError):
+                    os.unlink(lock_file.path)
+                    logger.info(f"Removed stale lock: {lock_file.name} (dead PID)")
+        except FileNotFoundError:
+            # Released between the scan and the read
+            continue
         except Exception as e:
             logger.warning(f"Error checking lock {lock_file.name}: {e}")
 
 
+def _wait_pid_exit(pid: int, timeout: float) -> bool:
+    """Wait up to ``timeout`` seconds for ``pid`` to exit; True once it is gone."""
+    try:
+        # Linux 5.3+: the pidfd turns readable the moment the process exits
+        fd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except (AttributeError, OSError):
+        fd = None
+
+    if fd is not None:
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        finally:
+            os.close(fd)
+
+    # Fallback (macOS, older kernels): probe the PID until it disappears
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(0.5, remaining))
+
+
 def stop_mcp_server(pid: int, timeout: int = 10, force: bool = False) -> bool:
     """Gracefully stop the MCP server process."""
     try:
         logger.info(f"Sending SIGTERM to PID {pid}")
         os.kill(pid, signal.SIGTERM)
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                os.kill(pid, 0)
-                time.sleep(0.5)
-            except ProcessLookupError:
-                logger.info(f"Process {pid} exited gracefully")
-                return True
+        if _wait_pid_exit(pid, timeout):
+            logger.info(f"Process {pid} exited gracefully")
+            return True
 
         logger.warning(f"Process {pid} did not exit after {timeout}s")
 
         if force:
             logger.warning(f"Force killing PID {pid} with SIGKILL")
             os.kill(pid, signal.SIGKILL)
-            time.sleep(1)
 
-            try:
-                os.kill(pid, 0)
-                logger.error(f"Failed to kill process {pid}")
-                return False
-            except ProcessLookupError:
+            if _wait_pid_exit(pid, 1):
                 logger.info(f"Process {pid} force killed")
                 return True
+            logger.error(f"Failed to kill process {pid}")
+            return False
 
         logger.error(f"Process {pid} still running (use --force to kill)")
         return False
@@ -126,8 +198,18 @@ def stop_mcp_server(pid: int, timeout: int = 10, force: bool = False) -> bool:
         return False
 
 
-def start_mcp_server() -> bool:
-    """Start the MCP server in the background."""
+def _read_tail(path: Path, size: int = 4096) -> str:
+    """Last ``size`` bytes of a log file, for error reports."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(max(0, f.seek(0, os.SEEK_END) - size))
+            return f.read().decode(errors="replace")
+    except OSError:
+        return ""
+
+
+def start_mcp_server(timeout: float = 60.0) -> bool:
+    """Start the MCP server in the background and wait until it reports ready."""
     try:
         venv_python = WORKSPACE_ROOT / ".venv" / "bin" / "python"
 
@@ -137,19 +219,47 @@ def start_mcp_server() -> bool:
 
         logger.info("Starting MCP server...")
 
-        process = subprocess.Popen(
-            [str(venv_python), "-m", "src.mcp.server"],
-            cwd=str(WORKSPACE_ROOT),
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,
-        )
+        # The server writes one byte to this pipe once the orchestrator and
+        # embedding model are loaded; EOF without it means the server died
+        ready_r, ready_w = os.pipe()
+
+        # stderr goes to a file rather than a pipe: the server outlives this
+        # script, and a pipe with no reader would break its logging
+        from src.utils.config import LOGS_DIR
+
+        stderr_path = LOGS_DIR / "mcp_server_stderr.log"
 
-        time.sleep(2)
+        # Popen already launches via vfork+exec on Linux (CPython 3.10+) when
+        # no preexec_fn is given; os.posix_spawn has no cwd, which -m needs
+        try:
+            with open(stderr_path, "wb") as stderr_log:
+                process = subprocess.Popen(
+                    [str(venv_python), "-m", "src.mcp.server"],
+                    cwd=str(WORKSPACE_ROOT),
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_log,
+                    start_new_session=True,
+                    pass_fds=(ready_w,),
+                    env={**os.environ, "ELEFANTE_READY_FD": str(ready_w)},
+                )
+        finally:
+            os.close(ready_w)
 
-        if process.poll() is not None:
-            logger.error(f"MCP server exited immediately with code {process.returncode}")
+        try:
+            readable, _, _ = select.select([ready_r], [], [], timeout)
+            signal_byte = os.read(ready_r, 1) if readable else None
+        finally:
+            os.close(ready_r)
+
+        if signal_byte == b"":
+            returncode = process.wait()
+            logger.error(
+                f"MCP server exited during start-up with code {returncode}\n"
+                f"{_read_tail(stderr_path)}"
+            )
             return False
+        if signal_byte is None:
+            logger.warning(f"MCP server not ready after {timeout:.0f}s; still starting")
 
         logger.info(f"MCP server started with PID {process.pid}")
         return True
@@ -162,8 +272,8 @@ def start_mcp_server() -> bool:
 def verify_restart(expected_version: str = None) -> bool:
     """Verify the MCP server restarted successfully."""
     try:
-        time.sleep(1)
-
+        # start_mcp_server() returns once the server signalled ready, so the
+        # process can be probed straight away
         new_pid = find_mcp_server_process()
         if not new_pid:
             logger.error("MCP server process not found after restart")
@@ -192,10 +302,14 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    logger.info("=" * 60)
-    logger.info("Elefante Safe Restart Utility")
-    logger.info(f"Time: {datetime.now().isoformat()}")
-    logger.info("=" * 60)
+    # Static banners go out as one record; step lines stay separate so they
+    # precede their work if the restart crashes
+    logger.info("\n".join((
+        "=" * 60,
+        "Elefante Safe Restart Utility",
+        f"Time: {datetime.now().isoformat()}",
+        "=" * 60,
+    )))
 
     logger.info("\n[1/5] Finding MCP server process...")
     current_pid = find_mcp_server_process()
@@ -232,12 +346,18 @@ def main() -> int:
     else:
         logger.info("\n[5/5] Skipping verification (use --verify to enable)")
 
-    logger.info("\n" + "=" * 60)
-    logger.info(" Elefante restart completed successfully")
-    logger.info("=" * 60)
+    logger.info("\n".join(("", "=" * 60, " Elefante restart completed successfully", "=" * 60)))
 
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    # SIGTERM (docker stop, systemd) takes the same path as Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        raise SystemExit(main())
+    except KeyboardInterrupt:
+        # Interrupted mid-restart: drop locks left by a server we already stopped
+        logger.warning("Restart interrupted - cleaning up lock files")
+        clean_locks()
+        raise SystemExit(130)
@@ -11,11 +11,15 @@ Usage:
 Notes:
 - The existing data dir is moved aside to data.pre_restore.<timestamp> unless --discard-existing is set.
 - This script performs file operations only (no DB access).
+- Incremental archives (backup_elefante_data.py --incremental) are restored
+  together with the earlier archives their MANIFEST.json refers to; those must
+  sit in the same directory.
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import shutil
 import zipfile
 from datetime import datetime
@@ -29,6 +33,36 @@ def _find_latest_backup(backup_dir: Path) -> Path:
     return backups[-1]
 
 
+# Written by backup_elefante_data.py --incremental
+MANIFEST_NAME = "MANIFEST.json"
+
+
+def _restore_plan(archive_path: Path) -> list[tuple[Path, list[str]]]:
+    """(archive, members) pairs that rebuild the data dir; a full archive is one pair.
+
+    Incremental archives also pull their unchanged files from the earlier
+    archives named in MANIFEST.json, one open per referenced archive.
+    """
+    with zipfile.ZipFile(archive_path, "r") as zf:
+        members = [name for name in zf.namelist() if name != MANIFEST_NAME]
+        if MANIFEST_NAME not in zf.NameToInfo:
+            return [(archive_path, members)]
+        unchanged = json.loads(zf.read(MANIFEST_NAME))["unchanged"]
+
+    by_archive: dict[str, list[str]] = {}
+    for arcname, ref in unchanged.items():
+        by_archive.setdefault(ref["archive"], []).append(arcname)
+
+    plan = []
+    for name, arcnames in by_archive.items():
+        source = archive_path.parent / name
+        if not source.exists():
+            raise SystemExit(f"[error] referenced archive not found: {source}")
+        plan.append((source, arcnames))
+    plan.append((archive_path, members))
+    return plan
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Restore Elefante data directory")
     parser.add_argument(
@@ -69,6 +103,10 @@ def main() -> int:
     if not archive_path.exists():
         raise SystemExit(f"[error] archive not found: {archive_path}")
 
+    # Resolved before the existing data is touched: a missing base archive
+    # must not leave an empty data dir behind
+    plan = _restore_plan(archive_path)
+
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     if data_dir.exists():
@@ -83,8 +121,9 @@ def main() -> int:
 
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    with zipfile.ZipFile(archive_path, "r") as zf:
-        zf.extractall(path=data_dir)
+    for source, members in plan:
+        with zipfile.ZipFile(source, "r") as zf:
+            zf.extractall(path=data_dir, members=members)
 
     print(f"[ok] restored data from: {archive_path}")
     print(f"[ok] data directory: {data_dir}")
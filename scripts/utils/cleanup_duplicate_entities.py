@@ -0,0 +1,180 @@
+"""
+Duplicate Entity Cleanup
+Removes duplicate Entity nodes (same name + type) from the Kuzu graph.
+
+GraphStore.create_or_get_entity() now deduplicates by name + type, but graphs
+written before that fix can still contain several nodes for one entity. This
+script keeps the oldest node of each group and DETACH DELETEs the rest.
+Memory nodes (type 'memory', named after the memory title) are never touched:
+two memories may legitimately share a title.
+
+Run:
+  .venv/bin/python scripts/utils/cleanup_duplicate_entities.py
+  .venv/bin/python scripts/utils/cleanup_duplicate_entities.py --db-path /path/to/kuzu_db
+"""
+
+import sys
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.graph_store import GraphStore
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def cleanup_duplicates(db_path: str = None):
+    """
+    Find duplicate entities by (name, type) and remove all but the oldest.
+
+    Args:
+        db_path: Kuzu database to clean (defaults to the configured one)
+
+    Returns:
+        Number of entities removed
+    """
+    print("[*] DUPLICATE ENTITY CLEANUP - Starting...")
+
+    graph_store = GraphStore(database_path=db_path)
+
+    # Kuzu's embedded connection is not safe for concurrent writes, so every
+    # query is pinned to one dedicated worker instead of the default pool.
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kuzu")
+    loop = asyncio.get_running_loop()
+
+    try:
+        # Every phase (pre-check, find, delete, verify) runs on one pinned handle
+        with graph_store._pinned_connection() as conn:
+
+            async def kexec(query, params=None, consume=list):
+                # ``consume`` folds the streamed rows on the worker thread, so callers
+                # that aggregate never hold the full result set as a list
+                return await loop.run_in_executor(
+                    executor,
+                    lambda: consume(graph_store._iter_query_results(conn.execute(query, params or {})))
+                )
+
+            return await _remove_duplicates(kexec)
+    finally:
+        executor.shutdown(wait=True)
+
+
+def _group_duplicates(rows):
+    """Fold streamed (name, type, id, created_at) rows, already ordered by key, into groups."""
+    return {
+        key: [{'id': row[2], 'created_at': row[3]} for row in group]
+        for key, group in groupby(rows, key=lambda row: (row[0], row[1]))
+    }
+
+
+def _count_rows(rows):
+    return sum(1 for _ in rows)
+
+
+async def _remove_duplicates(kexec):
+    """Run the find / report / delete / verify steps through ``kexec``."""
+    # Fast path: a clean graph (the steady state once create_or_get_entity
+    # deduplicates) is settled by one aggregate scan that returns a scalar
+    query_count_groups = """
+        MATCH (e:Entity)
+        WHERE e.type <> 'memory'
+        WITH e.name AS name, e.type AS type, count(*) AS instances
+        WHERE instances > 1
+        RETURN count(*)
+    """
+    duplicate_groups = (await kexec(query_count_groups))[0][0]
+    if duplicate_groups == 0:
+        print("[OK] No duplicates found - graph is clean")
+        return 0
+
+    # Step 1: Let Kuzu group by (name, type) and return only duplicate groups.
+    # Two passes: a scalar count per key first, then rows are returned only
+    # for keys seen more than once, oldest first within each group.
+    print("\n[*] Step 1: Finding duplicate entity groups...")
+    query_find_duplicates = """
+        MATCH (e:Entity)
+        WHERE e.type <> 'memory'
+        WITH e.name AS name, e.type AS type, count(*) AS instances
+        WHERE instances > 1
+        MATCH (d:Entity)
+        WHERE d.name = name AND d.type = type
+        RETURN name, type, d.id, d.created_at
+        ORDER BY name, type, d.created_at
+    """
+    duplicates = await kexec(query_find_duplicates, consume=_group_duplicates)
+
+    # Step 2: Report duplicate groups
+    print(f"\n[*] Step 2: Found {len(duplicates)} duplicate groups")
+    ids_to_remove = []
+    report = []
+    for (name, entity_type), entities in duplicates.items():
+        # ORDER BY created_at guarantees the first entity is the oldest
+        keep, remove = entities[0], entities[1:]
+        report.append(f"  [DUP] {name} ({entity_type}): {len(entities)} instances")
+        report.append(f"    keep:   {keep['id']} ({keep['created_at']})")
+        for entity in remove:
+            report.append(f"    remove: {entity['id']} ({entity['created_at']})")
+        ids_to_remove.extend(entity['id'] for entity in remove)
+    # One write for the whole report instead of a print per line
+    sys.stdout.write("\n".join(report) + "\n")
+
+    # Step 3: Remove duplicates in a single batched DETACH DELETE
+    print(f"\n[*] Step 3: Removing {len(ids_to_remove)} duplicate entities...")
+    # Kuzu has no secondary indexes; UNWIND lets the planner hash-join the id
+    # list against one Entity scan instead of a LIST_CONTAINS filter per row
+    query_delete = """
+        UNWIND $ids AS entity_id
+        MATCH (e:Entity)
+        WHERE e.id = entity_id
+        DETACH DELETE e
+    """
+    await kexec(query_delete, {"ids": ids_to_remove})
+    print(f"[OK] Removed {len(ids_to_remove)} entities")
+
+    # Step 4: Verify only the keys we touched instead of rescanning the graph
+    print("\n[*] Step 4: Verifying...")
+    # Project the key fields to scalars first: comparing against k.name /
+    # k.type directly makes Kuzu plan a cross product instead of a hash join
+    query_check_keys = """
+        UNWIND $keys AS k
+        WITH k.name AS key_name, k.type AS key_type
+        MATCH (e:Entity)
+        WHERE e.name = key_name AND e.type = key_type AND e.type <> 'memory'
+        WITH key_name AS name, key_type AS type, count(e) AS instances
+        WHERE instances > 1
+        RETURN name, type, instances
+    """
+    keys = [{"name": name, "type": entity_type} for name, entity_type in duplicates]
+    remaining_duplicates = await kexec(query_check_keys, {"keys": keys}, consume=_count_rows)
+    total_entities = (await kexec("MATCH (e:Entity) RETURN count(e)"))[0][0]
+
+    print("\n" + "=" * 60)
+    print(f"Total entities after cleanup: {total_entities}")
+    print(f"Remaining duplicate groups: {remaining_duplicates}")
+    print("=" * 60)
+
+    if remaining_duplicates:
+        print("[WARNING] Some duplicates remain - re-run the script")
+    else:
+        print("[SUCCESS] DUPLICATE CLEANUP COMPLETE")
+
+    return len(ids_to_remove)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Remove duplicate Entity nodes from the Kuzu graph")
+    parser.add_argument("--db-path", help="Kuzu database to clean (defaults to the configured one)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(cleanup_duplicates(args.db_path))
+    except Exception as e:
+        logger.error(f"Duplicate cleanup failed: {e}")
+        print(f"\n[ERROR] {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
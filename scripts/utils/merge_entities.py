@@ -0,0 +1,195 @@
+"""
+Entity Merge
+Merges Entity nodes that share a name (case-insensitive) and type into the oldest one.
+
+Older graphs can hold several nodes for one real-world entity (e.g. "Jaime"
+and "jaime" created by different ingest scripts). This script keeps the
+oldest node, re-points every edge of the others at it (RELATES_TO, PART_OF,
+DEPENDS_ON, REFERENCES, CREATED_IN and HAS_CONCEPT, properties included),
+then DETACH DELETEs the others. Memory nodes (type 'memory') are never
+merged, and nodes of different types are left alone unless --type picks one.
+
+Run:
+  .venv/bin/python scripts/utils/merge_entities.py Jaime
+  .venv/bin/python scripts/utils/merge_entities.py Jaime --type person
+"""
+
+import sys
+import asyncio
+import argparse
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.graph_store import get_graph_store
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Every rel table an Entity can sit on: name -> (label at the other end,
+# {property: column type}); the types pin down all-NULL UNWIND columns
+ENTITY_REL_TABLES = {
+    "RELATES_TO": ("Entity", {"strength": "DOUBLE"}),
+    "PART_OF": ("Entity", {}),
+    "DEPENDS_ON": ("Entity", {"description": "STRING"}),
+    "REFERENCES": ("Entity", {"reference_type": "STRING"}),
+    "CREATED_IN": ("Entity", {}),
+    "HAS_CONCEPT": ("Concept", {"created_at": "TIMESTAMP"}),
+}
+
+
+def _split_by_direction(props):
+    """Build a consumer folding streamed (other_id, direction, *props) rows into UNWIND params."""
+    def consume(rows):
+        outgoing, incoming = [], []
+        for tid, direction, *values in rows:
+            (outgoing if direction == "out" else incoming).append(
+                {"tid": tid, **dict(zip(props, values))}
+            )
+        return outgoing, incoming
+    return consume
+
+
+async def merge_entities(name: str, entity_type: str = None):
+    """
+    Merge every Entity named ``name`` (case-insensitive) into the oldest one.
+
+    Args:
+        name: Entity name to merge
+        entity_type: Only merge entities of this type (required when the
+            matches have more than one type)
+
+    Returns:
+        Number of entities merged away
+    """
+    print(f"[*] ENTITY MERGE - '{name}'" + (f" (type '{entity_type}')" if entity_type else ""))
+
+    # Process-wide store: the connection is opened once and reused
+    graph_store = get_graph_store()
+
+    # The steps are strictly sequential, so the whole find / redirect /
+    # delete / verify job runs in one thread hop on one pinned handle
+    return await graph_store.run_job(lambda kexec: _merge_sync(kexec, name, entity_type))
+
+
+def _merge_sync(kexec, name: str, entity_type: str = None):
+    """Run the merge steps synchronously through ``kexec``."""
+    # Memory nodes share the Entity table but are never merged by name
+    params = {"name": name}
+    type_filter = ""
+    if entity_type:
+        type_filter = "AND e.type = $type"
+        params["type"] = entity_type
+    query_find = f"""
+        MATCH (e:Entity)
+        WHERE lower(e.name) = lower($name) AND e.type <> 'memory' {type_filter}
+        RETURN e.id, e.name, e.type, e.created_at
+        ORDER BY e.created_at
+    """
+    entities = kexec(query_find, params)
+
+    if len(entities) < 2:
+        print(f"[OK] {len(entities)} entity named '{name}' - nothing to merge")
+        return 0
+
+    types = sorted({row[2] for row in entities})
+    if len(types) > 1:
+        print(f"[ERROR] '{name}' matches entities of different types: {', '.join(types)}")
+        print("        Pass --type to merge one of them")
+        return 0
+
+    keep_id = entities[0][0]
+    print(f"    keep:   {keep_id} ({entities[0][1]}, {entities[0][2]})")
+    for row in entities[1:]:
+        print(f"    merge:  {row[0]} ({row[1]}, {row[2]})")
+
+    remove_ids = [row[0] for row in entities[1:]]
+    merged_ids = [keep_id] + remove_ids
+
+    # Outgoing and incoming edges of the nodes being merged away, per rel
+    # table, skipping edges between the merged nodes themselves; one UNWIND
+    # per table and direction re-creates them on the kept node, and MERGE
+    # skips edges the kept node already has
+    print("\n[*] Redirecting relationships...")
+    for table, (label, props) in ENTITY_REL_TABLES.items():
+        columns = "".join(f", rel.{p} AS {p}" for p in props)
+        query_find_rels = f"""
+            MATCH (r:Entity)-[rel:{table}]->(t:{label})
+            WHERE list_contains($remove_ids, r.id) AND NOT list_contains($merged_ids, t.id)
+            RETURN t.id AS tid, 'out' AS direction{columns}
+        """
+        if label == "Entity":
+            query_find_rels += f"""
+            UNION ALL
+            MATCH (s:Entity)-[rel:{table}]->(r:Entity)
+            WHERE list_contains($remove_ids, r.id) AND NOT list_contains($merged_ids, s.id)
+            RETURN s.id AS tid, 'in' AS direction{columns}
+            """
+        outgoing, incoming = kexec(
+            query_find_rels,
+            {"remove_ids": remove_ids, "merged_ids": merged_ids},
+            consume=_split_by_direction(tuple(props))
+        )
+        if not outgoing and not incoming:
+            continue
+        print(f"    {table}: {len(outgoing)} outgoing, {len(incoming)} incoming")
+
+        fields = "".join(f", CAST(row.{p} AS {t}) AS {p}" for p, t in props.items())
+        on_create = ("ON CREATE SET " + ", ".join(f"rel.{p} = {p}" for p in props)) if props else ""
+        query_redirect_out = f"""
+            UNWIND $rows AS row
+            WITH row.tid AS tid{fields}
+            MATCH (k:Entity), (t:{label})
+            WHERE k.id = $keep_id AND t.id = tid
+            MERGE (k)-[rel:{table}]->(t)
+            {on_create}
+        """
+        query_redirect_in = f"""
+            UNWIND $rows AS row
+            WITH row.tid AS tid{fields}
+            MATCH (s:Entity), (k:Entity)
+            WHERE s.id = tid AND k.id = $keep_id
+            MERGE (s)-[rel:{table}]->(k)
+            {on_create}
+        """
+        for query, rows in ((query_redirect_out, outgoing), (query_redirect_in, incoming)):
+            if rows:
+                kexec(query, {"keep_id": keep_id, "rows": rows})
+
+    print(f"[*] Removing {len(remove_ids)} merged entities...")
+    query_delete = """
+        UNWIND $ids AS entity_id
+        MATCH (e:Entity)
+        WHERE e.id = entity_id
+        DETACH DELETE e
+        RETURN count(*)
+    """
+    # The delete reports how many nodes it removed, so verifying needs no
+    # second lookup by name
+    deleted = kexec(query_delete, {"ids": remove_ids})[0][0]
+
+    print("\n" + "=" * 60)
+    print(f"Entities merged away: {deleted} of {len(remove_ids)}")
+    print("=" * 60)
+
+    if deleted == len(remove_ids):
+        print("[SUCCESS] ENTITY MERGE COMPLETE")
+    else:
+        print("[WARNING] Merge incomplete - re-run the script")
+
+    return deleted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge Entity nodes that share a name")
+    parser.add_argument("name", help="Entity name (case-insensitive)")
+    parser.add_argument("--type", dest="entity_type", default=None, help="Only merge entities of this type")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(merge_entities(args.name, args.entity_type))
+    except Exception as e:
+        logger.error(f"Entity merge failed: {e}")
+        print(f"\n[ERROR] {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -6,10 +6,11 @@ redundant results from appearing when the same content exists in
 multiple sources (conversation + stored memory).
 """
 
-import asyncio
 from typing import List, Set, Dict, Optional
 from uuid import UUID
 
+import numpy as np
+
 from src.models.conversation import SearchCandidate
 from src.core.embeddings import get_embedding_service
 from src.utils.logger import get_logger
@@ -107,19 +108,18 @@ class ResultDeduplicator:
         Returns:
             Candidates with embeddings populated
         """
-        tasks = []
+        texts = []
         indices_needing_embeddings = []
         
         for i, candidate in enumerate(candidates):
             if candidate.embedding is None:
                 indices_needing_embeddings.append(i)
-                tasks.append(
-                    self.embedding_service.generate_embedding(candidate.text)
-                )
+                texts.append(candidate.text)
         
-        if tasks:
-            self.logger.debug(f"Generating {len(tasks)} embeddings for deduplication")
-            embeddings = await asyncio.gather(*tasks)
+        if texts:
+            self.logger.debug(f"Generating {len(texts)} embeddings for deduplication")
+            # One batched encode instead of a concurrent encode per candidate
+            embeddings = await self.embedding_service.generate_embeddings_batch(texts)
             
             # Assign embeddings back to candidates
             for idx, embedding in zip(indices_needing_embeddings, embeddings):
@@ -144,6 +144,10 @@ class ResultDeduplicator:
         visited = [False] * n
         groups = []
         
+        # All pairwise similarities in one matrix product instead of a
+        # Python-level cosine per pair
+        similarities = self._similarity_matrix(candidates)
+        
         for i in range(n):
             if visited[i]:
                 continue
@@ -157,14 +161,17 @@ class ResultDeduplicator:
                 if visited[j]:
                     continue
                 
-                # Skip if either embedding is None (shouldn't happen after _ensure_embeddings)
-                emb_i = candidates[i].embedding
-                emb_j = candidates[j].embedding
-                
-                if emb_i is None or emb_j is None:
-                    continue
-                
-                similarity = self._cosine_similarity(emb_i, emb_j)
+                if similarities is not None:
+                    similarity = similarities[i, j]
+                else:
+                    # Skip if either embedding is None (shouldn't happen after _ensure_embeddings)
+                    emb_i = candidates[i].embedding
+                    emb_j = candidates[j].embedding
+                    
+                    if emb_i is None or emb_j is None:
+                        continue
+                    
+                    similarity = self._cosine_similarity(emb_i, emb_j)
                 
                 if similarity >= self.threshold:
                     group.add(j)
@@ -277,6 +284,49 @@ class ResultDeduplicator:
         
         return merged
     
+    def _similarity_matrix(
+        self,
+        candidates: List[SearchCandidate]
+    ) -> Optional[np.ndarray]:
+        """
+        Calculate the pairwise cosine similarity matrix for all candidates
+        
+        Scores match _cosine_similarity: empty and zero-norm embeddings score
+        0.0. Candidates without an embedding get a similarity of -1.0 to every
+        other candidate, so they never join a group.
+        
+        Args:
+            candidates: List of candidates with embeddings
+        
+        Returns:
+            n x n similarity matrix, or None if embedding dimensions differ
+            (callers fall back to the pairwise calculation)
+        """
+        present = [i for i, c in enumerate(candidates) if c.embedding is not None]
+        if not present:
+            return np.full((len(candidates), len(candidates)), -1.0)
+        
+        dimensions = {len(candidates[i].embedding) for i in present if candidates[i].embedding}
+        if len(dimensions) > 1:
+            self.logger.warning("Embedding dimension mismatch")
+            return None
+        
+        # An empty embedding stays a zero row, which scores 0.0 against everything
+        vectors = np.zeros((len(candidates), dimensions.pop() if dimensions else 1), dtype=np.float64)
+        for i in present:
+            if candidates[i].embedding:
+                vectors[i] = candidates[i].embedding
+        
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        similarities = np.clip(unit @ unit.T, 0.0, 1.0)
+        
+        missing = np.ones(len(candidates), dtype=bool)
+        missing[present] = False
+        similarities[missing, :] = -1.0
+        similarities[:, missing] = -1.0
+        return similarities
+    
     def _cosine_similarity(
         self,
         embedding1: List[float],
@@ -6,8 +6,9 @@ locally using Sentence Transformers.
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any
-from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
 import numpy as np
 
 from src.utils.config import get_config
@@ -42,6 +43,19 @@ class EmbeddingService:
         self._model = None
         self._dimension = None
         
+        # Encodes run one at a time on a dedicated thread: torch already spreads
+        # a single encode over every core, so concurrent calls only contend.
+        # Callers that need throughput should batch (generate_embeddings_batch).
+        self._encode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
+        
+        # LRU of query text -> embedding; see generate_query_embedding
+        self._query_cache: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._query_cache_size = 1000
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+        # Query text -> in-flight encode, so concurrent misses share one
+        self._query_pending: Dict[str, asyncio.Future] = {}
+        
         logger.info(
             "initializing_embedding_service",
             provider=self.provider,
@@ -151,7 +165,7 @@ class EmbeddingService:
             )
             return embeddings.tolist()
         
-        embeddings = await loop.run_in_executor(None, _encode)
+        embeddings = await loop.run_in_executor(self._encode_executor, _encode)
         return embeddings
     
     def get_embedding_dimension(self) -> int:
@@ -165,31 +179,78 @@ class EmbeddingService:
             self._load_model()
         return self._dimension
     
-    @lru_cache(maxsize=1000)
-    def _cached_embedding(self, text: str) -> tuple:
+    async def generate_query_embedding(self, query: str) -> List[float]:
+        """
+        Generate embedding for a search query, reusing recent results
+        
+        Searches repeat the same query text (federated search looks it up for
+        both of its buckets at once, and callers re-run common queries), so
+        query embeddings are kept in a small LRU keyed on the exact text, and
+        concurrent lookups of an uncached query share one encode. Memory
+        content is not cached; use generate_embedding for that.
+        
+        Args:
+            query: Query text to embed
+            
+        Returns:
+            Embedding vector as list of floats
+        """
+        cached = self._query_cache.get(query)
+        if cached is not None:
+            self._query_cache.move_to_end(query)
+            self._query_cache_hits += 1
+            return list(cached)
+        
+        pending = self._query_pending.get(query)
+        if pending is not None:
+            # Same query already being embedded by a concurrent search
+            self._query_cache_hits += 1
+            return list(await asyncio.shield(pending))
+        
+        self._query_cache_misses += 1
+        pending = asyncio.ensure_future(self.generate_embedding(query))
+        self._query_pending[query] = pending
+        try:
+            embedding = await asyncio.shield(pending)
+        finally:
+            self._query_pending.pop(query, None)
+        
+        self._query_cache[query] = tuple(embedding)
+        if len(self._query_cache) > self._query_cache_size:
+            self._query_cache.popitem(last=False)
+        return list(embedding)
+    
+    async def prime_query_embeddings(self, queries: List[str]) -> None:
         """
-        Cached embedding generation (synchronous)
+        Embed the uncached queries in one batch and add them to the query cache
         
-        Note: Returns tuple for hashability in lru_cache
+        Args:
+            queries: Query texts that will be looked up next
         """
-        # This is a synchronous wrapper for caching
-        # In practice, use async version for new embeddings
-        embeddings = asyncio.run(self.generate_embedding(text))
-        return tuple(embeddings)
+        missing = [q for q in dict.fromkeys(queries) if q not in self._query_cache]
+        if not missing:
+            return
+        
+        embeddings = await self.generate_embeddings_batch(missing)
+        for query, embedding in zip(missing, embeddings):
+            self._query_cache[query] = tuple(embedding)
+        while len(self._query_cache) > self._query_cache_size:
+            self._query_cache.popitem(last=False)
     
     def clear_cache(self):
         """Clear the embedding cache"""
-        self._cached_embedding.cache_clear()
+        self._query_cache.clear()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
         logger.info("embedding_cache_cleared")
     
     def get_cache_info(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        info = self._cached_embedding.cache_info()
         return {
-            "hits": info.hits,
-            "misses": info.misses,
-            "size": info.currsize,
-            "max_size": info.maxsize
+            "hits": self._query_cache_hits,
+            "misses": self._query_cache_misses,
+            "size": len(self._query_cache),
+            "max_size": self._query_cache_size
         }
     
     async def compute_similarity(
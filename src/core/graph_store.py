@@ -6,7 +6,8 @@ Supports Cypher-like queries for deterministic fact retrieval.
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any, Tuple
+from contextlib import contextmanager
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from uuid import UUID
 from datetime import datetime
 from pathlib import Path
@@ -45,6 +46,8 @@ class GraphStore:
         self._db = None
         self._schema_initialized = False
         self._lock = None  # For thread safety
+        self._pins = 0  # Open _pinned_connection() jobs; close() waits for them
+        self._close_pending = False
         
         logger.info(
             "initializing_graph_store",
@@ -160,6 +163,16 @@ class GraphStore:
 
     def close(self):
         """Explicitly close connection and database to release locks."""
+        if self._lock is not None:
+            with self._lock:
+                if self._pins:
+                    # A pinned job is still running statements on this handle;
+                    # the last pin to be released performs the close
+                    self._close_pending = True
+                    logger.info("kuzu_close_deferred_while_pinned")
+                    return
+                self._close_pending = False
+        
         if self._conn:
             # self._conn.close() # Kuzu Connection object doesn't have close(), it just goes out of scope? 
             # Double check docs, but assuming we drop ref.
@@ -174,6 +187,28 @@ class GraphStore:
              
         logger.info("kuzu_connection_closed")
 
+    @contextmanager
+    def _pinned_connection(self):
+        """
+        Pin the current Kuzu connection for a multi-statement job.
+
+        Yields the live connection. While any pin is held, close() is
+        deferred until the last pin is released, so the handle cannot be
+        dropped or swapped in the middle of the job.
+        """
+        self._initialize_connection()
+        with self._lock:
+            self._pins += 1
+            conn = self._conn
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                self._pins -= 1
+                close_now = self._pins == 0 and self._close_pending
+            if close_now:
+                self.close()
+
     def __enter__(self):
         """Context manager entry."""
         self._initialize_connection()
@@ -195,10 +230,15 @@ class GraphStore:
         Helper to extract all rows from a Kuzu QueryResult.
         Kuzu 0.1.0 uses has_next() and get_next() instead of get_all()
         """
-        rows = []
+        return list(self._iter_query_results(result))
+
+    def _iter_query_results(self, result):
+        """
+        Stream rows from a Kuzu QueryResult one at a time.
+        Lets callers fold rows as they arrive instead of materializing a list.
+        """
         while result.has_next():
-            rows.append(result.get_next())
-        return rows
+            yield result.get_next()
     
     def _initialize_schema(self):
         """Initialize Kuzu schema (node and relationship tables)"""
@@ -709,6 +749,40 @@ class GraphStore:
             logger.error("query_execution_failed", query=cypher_query[:100], error=str(e))
             raise
     
+    async def run_job(self, job: Callable[[Callable[..., Any]], Any]) -> Any:
+        """
+        Run a multi-statement maintenance job on one pinned connection
+        
+        The whole job runs synchronously in a single worker-thread hop, and
+        every statement goes to the same Kuzu handle. ``job`` receives
+        ``kexec(query, params=None, consume=list)``, which executes one
+        statement and returns ``consume`` applied to its streamed rows.
+        Statements are not passed through validate_cypher_query, so jobs can
+        DELETE/MERGE; never pass user-supplied query text.
+        
+        Args:
+            job: Callable taking ``kexec`` and returning the job's result
+            
+        Returns:
+            Whatever ``job`` returns
+        """
+        self._initialize_connection()
+        
+        def _run():
+            with self._pinned_connection() as conn:
+                
+                def kexec(query, params=None, consume=list):
+                    try:
+                        result = conn.execute(query, params or {})
+                        return consume(self._iter_query_results(result))
+                    except Exception as e:
+                        logger.error("query_execution_failed", query=query[:100], error=str(e))
+                        raise
+                
+                return job(kexec)
+        
+        return await asyncio.to_thread(_run)
+    
     async def find_path(
         self,
         from_entity_id: UUID,
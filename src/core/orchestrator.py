@@ -51,6 +51,11 @@ class MemoryOrchestrator:
     - Retrieving context for sessions/tasks
     """
     
+    # enqueue_memory() batching: flush a batch at this many items, or once the
+    # first queued item has waited this long
+    WRITE_BATCH_MAX_ITEMS = 32
+    WRITE_BATCH_WAIT_SECONDS = 0.05
+
     def __init__(
         self,
         vector_store: Optional[VectorStore] = None,
@@ -78,6 +83,13 @@ class MemoryOrchestrator:
         self._metadata_init_task: Optional[asyncio.Task] = None
         self._metadata_initialized: bool = False
 
+        # Write-back queue for enqueue_memory(); created on first use so it
+        # binds to the caller's running loop, and recreated when a later
+        # asyncio.run() calls in on a new loop
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._write_task: Optional[asyncio.Task] = None
+        self._write_loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Initialize metadata store if we're already inside a running event loop.
         # In synchronous contexts (e.g., pytest fixtures), defer initialization until first use.
         try:
@@ -100,6 +112,26 @@ class MemoryOrchestrator:
             await self.metadata_store.initialize()
 
         self._metadata_initialized = True
+
+    async def prewarm(self) -> None:
+        """
+        Load the embedding model and open every store ahead of the first request.
+
+        Without this, the first add_memory/search_memories call pays for the
+        model load and the ChromaDB/Kuzu/SQLite connections.
+        """
+        def _warm_vector_store():
+            # Chroma client start-up blocks; keep it off the serving loop
+            self.vector_store._initialize_client()
+            self.vector_store._collection.count()
+
+        await asyncio.gather(
+            self.graph_store.execute_query("RETURN 1"),
+            self._ensure_metadata_initialized(),
+            asyncio.to_thread(_warm_vector_store),
+            self.embedding_service.generate_embedding("warmup"),
+        )
+        self.logger.info("Memory orchestrator prewarmed")
     
     async def add_memory(
         self,
@@ -109,7 +141,8 @@ class MemoryOrchestrator:
         entities: List[Dict[str, str]] = None,
         metadata: Dict[str, Any] = None,
         importance: int = 1,
-        force_new: bool = False
+        force_new: bool = False,
+        embedding: Optional[List[float]] = None
     ) -> Optional[Memory]:
         """
         Add a new memory via the Authoritative 5-Step Pipeline.
@@ -120,6 +153,9 @@ class MemoryOrchestrator:
         3. WRITE: Construct Memory object with V2 metadata (Layers).
         4. REINFORCE: Initialize plasticity (access_count=1) and decay signals.
         5. GRAPH: Create Entity nodes and Relationships.
+
+        A precomputed content ``embedding`` may be passed (see add_memories)
+        to skip generating it here.
         """
         await self._ensure_metadata_initialized()
 
@@ -366,7 +402,8 @@ class MemoryOrchestrator:
         # ==================================================================================
         # STEP 2: INTEGRITY (Duplicate & Contradiction Check)
         # ==================================================================================
-        embedding = await self.embedding_service.generate_embedding(content)
+        if embedding is None:
+            embedding = await self.embedding_service.generate_embedding(content)
         
         similar_memories = []
         if not force_new:
@@ -653,6 +690,137 @@ class MemoryOrchestrator:
             self.logger.error(f"Failed to store memory: {e}", exc_info=True)
             raise
     
+    async def add_memories(
+        self,
+        memories: List[Dict[str, Any]],
+        return_exceptions: bool = False
+    ) -> List[Optional[Memory]]:
+        """
+        Add several memories, embedding all of their contents in one batch.
+
+        Each item holds the same keyword arguments as add_memory(). Items are
+        written in order, so later items see earlier ones during the
+        REDUNDANT/CONTRADICTORY integrity checks. An item that already carries
+        an "embedding" keeps it and is left out of the batch.
+
+        Args:
+            memories: List of add_memory() keyword-argument dicts
+            return_exceptions: As in asyncio.gather - return a failing item's
+                exception in its slot and carry on, instead of raising. A
+                failed batch embedding is returned in every item's slot.
+
+        Returns:
+            Stored memories in input order (None where a memory was blocked or ignored)
+        """
+        if not memories:
+            return []
+
+        # Copies, so popping a caller-supplied embedding leaves the input intact
+        specs = [dict(spec) for spec in memories]
+        embeddings = [spec.pop("embedding", None) for spec in specs]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        # One model forward pass for the whole batch instead of one per memory
+        if missing:
+            try:
+                batch = await self.embedding_service.generate_embeddings_batch(
+                    [specs[i]["content"] for i in missing]
+                )
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                self.logger.error(f"Batch embedding of {len(missing)} memories failed: {e}")
+                return [e] * len(specs)
+            for i, embedding in zip(missing, batch):
+                embeddings[i] = embedding
+
+        results: List[Optional[Memory]] = []
+        for spec, embedding in zip(specs, embeddings):
+            try:
+                results.append(await self.add_memory(**spec, embedding=embedding))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    def enqueue_memory(self, memory: Dict[str, Any]) -> "asyncio.Future[Optional[Memory]]":
+        """
+        Queue a memory for a background batched write and return immediately.
+
+        A drain task started on first use collects queued items into batches of
+        up to WRITE_BATCH_MAX_ITEMS, waiting at most WRITE_BATCH_WAIT_SECONDS
+        for a batch to fill, and stores each batch with add_memories(). Call
+        flush() before reading the results back or exiting.
+
+        Args:
+            memory: add_memory() keyword-argument dict
+
+        Returns:
+            Future resolving to the stored memory (None if blocked or ignored),
+            or to the exception that failed this item
+        """
+        loop = asyncio.get_running_loop()
+        if self._write_queue is None or self._write_loop is not loop:
+            # An asyncio.Queue is bound to the loop that first uses it, so a
+            # queue left over from an earlier loop cannot be reused here
+            self._write_queue = asyncio.Queue()
+            self._write_task = None
+            self._write_loop = loop
+        if self._write_task is None or self._write_task.done():
+            self._write_task = loop.create_task(self._drain_write_queue(self._write_queue))
+
+        future = loop.create_future()
+        self._write_queue.put_nowait((memory, future))
+        return future
+
+    async def flush(self) -> None:
+        """Wait until every memory queued with enqueue_memory() has been written."""
+        # Nothing can be pending on a queue owned by an earlier loop
+        if self._write_queue is not None and self._write_loop is asyncio.get_running_loop():
+            await self._write_queue.join()
+
+    async def _drain_write_queue(self, queue: asyncio.Queue) -> None:
+        """Background loop behind enqueue_memory(): batch queued items into add_memories()."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            try:
+                deadline = loop.time() + self.WRITE_BATCH_WAIT_SECONDS
+                while len(batch) < self.WRITE_BATCH_MAX_ITEMS:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                try:
+                    results = await self.add_memories(
+                        [memory for memory, _ in batch], return_exceptions=True
+                    )
+                except Exception as e:
+                    # Batch-level failure (e.g. embedding): fail every item in it
+                    self.logger.error(f"Write queue batch of {len(batch)} failed: {e}", exc_info=True)
+                    results = [e] * len(batch)
+
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        if isinstance(result, Exception):
+                            future.set_exception(result)
+                        else:
+                            future.set_result(result)
+            except asyncio.CancelledError:
+                # Cancelled mid-batch: callers awaiting these items see it too
+                for _, future in batch:
+                    future.cancel()
+                raise
+            finally:
+                # Every item taken is accounted for, or flush() would hang
+                for _ in batch:
+                    queue.task_done()
+
     async def search_memories(
         self,
         query: str,
@@ -759,6 +927,34 @@ class MemoryOrchestrator:
         except Exception as e:
             self.logger.error(f"Search failed: {e}", exc_info=True)
             raise
+
+    async def search_memories_batch(
+        self,
+        queries: List[str],
+        **kwargs: Any
+    ) -> List[List[SearchResult]]:
+        """
+        Run several searches, embedding all of their queries in one batch.
+
+        Each query is searched exactly as search_memories() would search it;
+        only the query embeddings are computed up front, in one forward pass.
+
+        Args:
+            queries: Search query strings
+            **kwargs: search_memories() arguments applied to every query
+
+        Returns:
+            One result list per query, in input order
+        """
+        if not queries:
+            return []
+
+        if kwargs.get("include_stored", True) and kwargs.get("mode", QueryMode.HYBRID) != QueryMode.STRUCTURED:
+            await self.vector_store.prime_query_embeddings(queries)
+
+        return list(await asyncio.gather(
+            *(self.search_memories(query, **kwargs) for query in queries)
+        ))
     
     def _create_query_plan(
         self,
@@ -915,21 +1111,23 @@ class MemoryOrchestrator:
         anchor_fetch = max(3, int(plan.limit * 0.7))
         general_fetch = max(plan.limit * 3, 10)
 
-        anchors = await self.vector_store.search(
-            query=query,
-            limit=anchor_fetch,
-            filters=filters,
-            where_override={"ring": {"$in": ["core", "domain"]}},
-            min_similarity=plan.min_similarity,
-            apply_temporal_decay=apply_temporal_decay,
-        )
-
-        general = await self.vector_store.search(
-            query=query,
-            limit=general_fetch,
-            filters=filters,
-            min_similarity=plan.min_similarity,
-            apply_temporal_decay=apply_temporal_decay,
+        # The two buckets are independent queries; run them concurrently
+        anchors, general = await asyncio.gather(
+            self.vector_store.search(
+                query=query,
+                limit=anchor_fetch,
+                filters=filters,
+                where_override={"ring": {"$in": ["core", "domain"]}},
+                min_similarity=plan.min_similarity,
+                apply_temporal_decay=apply_temporal_decay,
+            ),
+            self.vector_store.search(
+                query=query,
+                limit=general_fetch,
+                filters=filters,
+                min_similarity=plan.min_similarity,
+                apply_temporal_decay=apply_temporal_decay,
+            ),
         )
 
         # Remove duplicates from general bucket
@@ -990,23 +1188,24 @@ class MemoryOrchestrator:
         apply_temporal_decay: bool = True
     ) -> List[SearchResult]:
         """Execute structured search via graph store with optional temporal decay"""
-        # Build Cypher query based on filters
-        cypher_parts = ["MATCH (m:Entity {type: 'memory'})"]
-        where_clauses = []
+        # Build Cypher query based on filters. Values are bound as parameters so
+        # the query text only varies with which filters are set and Kuzu can
+        # reuse its prepared plan across searches.
+        cypher_parts = ["MATCH (m:Entity) WHERE m.type = $entity_type"]
+        params: Dict[str, Any] = {"entity_type": "memory", "limit": plan.limit}
         
         if plan.memory_types:
-            where_clauses.append(f"m.memory_type IN {plan.memory_types}")
+            cypher_parts.append("AND m.memory_type IN $memory_types")
+            params["memory_types"] = plan.memory_types
         if plan.min_importance:
-            where_clauses.append(f"m.importance >= {plan.min_importance}")
-        
-        if where_clauses:
-            cypher_parts.append("WHERE " + " AND ".join(where_clauses))
+            cypher_parts.append("AND m.importance >= $min_importance")
+            params["min_importance"] = plan.min_importance
         
-        cypher_parts.append(f"RETURN m LIMIT {plan.limit}")
+        cypher_parts.append("RETURN m LIMIT $limit")
         cypher_query = " ".join(cypher_parts)
         
         # Execute query
-        graph_results = await self.graph_store.execute_query(cypher_query)
+        graph_results = await self.graph_store.execute_query(cypher_query, params)
         
         # Convert to SearchResult objects
         # Note: Graph results don't have similarity scores, so we use importance as a proxy.
@@ -1097,17 +1296,19 @@ class MemoryOrchestrator:
         
         # Apply Temporal Decay & Reinforcement (Read-Side Plasticity)
         if apply_temporal_decay:
+            # Decay every result against the same instant
+            current_time = datetime.utcnow()
+            
+            # Blend with graph score (importance-based)
+            # Config defaults: semantic=0.7, temporal=0.3
+            # For graph, we treat importance as the "semantic" signal
+            semantic_weight = 0.7 
+            temporal_weight = 0.3
+            
             for result in results:
                 # Calculate temporal score (even if just based on current time for graph results)
-                current_time = datetime.utcnow()
                 temporal_score = result.memory.calculate_relevance_score(current_time)
                 
-                # Blend with graph score (importance-based)
-                # Config defaults: semantic=0.7, temporal=0.3
-                # For graph, we treat importance as the "semantic" signal
-                semantic_weight = 0.7 
-                temporal_weight = 0.3
-                
                 # Re-calculate score
                 result.score = (semantic_weight * result.score) + (temporal_weight * temporal_score)
                 result.score = max(0.0, min(1.0, result.score))
@@ -2064,6 +2265,11 @@ class MemoryOrchestrator:
     async def close(self):
         """Close all database connections"""
         self.logger.info("Closing orchestrator connections")
+        await self.flush()
+        if self._write_task is not None:
+            if self._write_loop is asyncio.get_running_loop():
+                self._write_task.cancel()
+            self._write_task = None
         # Connections are managed by singleton instances
         # No explicit close needed for ChromaDB/Kuzu in current implementation
 
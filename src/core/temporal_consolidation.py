@@ -109,12 +109,16 @@ class TemporalConsolidator:
             self.logger.error(f"Failed to archive memory {memory.id}: {e}")
             return False
     
-    async def consolidate_weak_memories(self, force: bool = False) -> Dict[str, Any]:
+    async def consolidate_weak_memories(self, force: bool = False, return_stats: bool = False) -> Dict[str, Any]:
         """
         Main consolidation process:
         1. Find weak memories
         2. Archive those below archive threshold
         3. Report statistics
+
+        With return_stats=True the strength distribution from
+        get_consolidation_stats() is computed from the same scan and
+        returned under "stats", so callers need only one pass.
         """
         self.logger.info("Starting temporal consolidation process...")
         
@@ -127,7 +131,15 @@ class TemporalConsolidator:
         }
         
         # Find weak memories
-        weak_memories = await self.find_weak_memories(limit=100)
+        if return_stats:
+            all_memories = await self.vector_store.get_all(limit=500)
+            scored = [(m, self.calculate_temporal_strength(m)) for m in all_memories]
+            stats["stats"] = self._strength_stats([strength for _, strength in scored])
+            weak_memories = sorted(
+                (pair for pair in scored if pair[1] < self.weak_threshold), key=lambda x: x[1]
+            )[:100]
+        else:
+            weak_memories = await self.find_weak_memories(limit=100)
         stats["scanned"] = len(weak_memories)
         stats["weak_found"] = len(weak_memories)
         
@@ -162,8 +174,10 @@ class TemporalConsolidator:
         # get_all returns List[Memory] directly
         all_memories = await self.vector_store.get_all(limit=500)
         
-        strengths = [self.calculate_temporal_strength(m) for m in all_memories]
-        
+        return self._strength_stats([self.calculate_temporal_strength(m) for m in all_memories])
+    
+    def _strength_stats(self, strengths: List[float]) -> Dict[str, Any]:
+        """Summarize a list of temporal strengths."""
         if not strengths:
             return {
                 "total_memories": 0,
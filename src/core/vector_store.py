@@ -22,6 +22,36 @@ from src.utils.validators import validate_memory_content, validate_limit
 logger = get_logger(__name__)
 
 
+def _expand_query_text(q: str) -> str:
+    """Deterministic query expansion to improve semantic recall for novel phrasings"""
+    ql = (q or "").lower()
+    expansions: list[str] = []
+
+    # Core concept expansions (no LLM, static, enforceable)
+    if any(k in ql for k in ["ide", "editor", "vs code", "vscode", "visual studio code"]):
+        expansions += ["editor", "IDE", "VS Code", "Visual Studio Code", "Copilot"]
+    if any(k in ql for k in ["indent", "whitespace", "formatting", "tabs", "spaces"]):
+        expansions += ["indentation", "spaces", "tabs", "Python formatting", "code style"]
+    if any(k in ql for k in ["docstring", "document", "documentation", "args", "returns", "raises"]):
+        expansions += ["docstrings", "Google style", "Args", "Returns", "Raises", "function documentation"]
+    if any(k in ql for k in ["api", "endpoint", "response", "json", "error"]):
+        expansions += ["API response format", "JSON structure", "success boolean", "error field"]
+    if any(k in ql for k in ["git", "branch", "workflow", "feature", "pull request", "pr", "main"]):
+        expansions += ["feature branch", "feat/", "pull request", "PR", "main branch", "branch naming"]
+    if any(k in ql for k in ["test", "pytest", "verify", "commit", "push"]):
+        expansions += ["pytest", "pre-commit", "before push", "tests must pass"]
+    if any(k in ql for k in ["performance", "latency", "query", "database", "index"]):
+        expansions += ["database query performance", "100ms", "index", "optimize query"]
+    if any(k in ql for k in ["framework", "rest", "django", "fastapi", "api"]):
+        expansions += ["FastAPI", "REST", "Django", "OpenAPI docs"]
+
+    # Merge unique expansions with original query
+    if expansions:
+        expanded = q + " \n" + " ".join(sorted(set(expansions)))
+        return expanded
+    return q
+
+
 class VectorStore:
     """
     Vector store for semantic memory using ChromaDB
@@ -229,6 +259,20 @@ class VectorStore:
             logger.error("failed_to_add_memory", memory_id=str(memory.id), error=str(e))
             raise
     
+    async def prime_query_embeddings(self, queries: List[str]) -> None:
+        """
+        Embed several search queries in one batch ahead of search()
+        
+        Fills the embedding service's query cache with the expanded text
+        search() will look up, so the searches that follow skip the model.
+        
+        Args:
+            queries: Search query texts
+        """
+        await self._embedding_service.prime_query_embeddings(
+            [_expand_query_text(q) for q in queries]
+        )
+    
     async def search(
         self,
         query: str,
@@ -267,40 +311,11 @@ class VectorStore:
         # Get more results if temporal decay is enabled (for re-ranking)
         search_limit = limit * 2 if temporal_enabled else limit
         
-        # Deterministic query expansion to improve semantic recall for novel phrasings
-        def _expand_query_text(q: str) -> str:
-            ql = (q or "").lower()
-            expansions: list[str] = []
-
-            # Core concept expansions (no LLM, static, enforceable)
-            if any(k in ql for k in ["ide", "editor", "vs code", "vscode", "visual studio code"]):
-                expansions += ["editor", "IDE", "VS Code", "Visual Studio Code", "Copilot"]
-            if any(k in ql for k in ["indent", "whitespace", "formatting", "tabs", "spaces"]):
-                expansions += ["indentation", "spaces", "tabs", "Python formatting", "code style"]
-            if any(k in ql for k in ["docstring", "document", "documentation", "args", "returns", "raises"]):
-                expansions += ["docstrings", "Google style", "Args", "Returns", "Raises", "function documentation"]
-            if any(k in ql for k in ["api", "endpoint", "response", "json", "error"]):
-                expansions += ["API response format", "JSON structure", "success boolean", "error field"]
-            if any(k in ql for k in ["git", "branch", "workflow", "feature", "pull request", "pr", "main"]):
-                expansions += ["feature branch", "feat/", "pull request", "PR", "main branch", "branch naming"]
-            if any(k in ql for k in ["test", "pytest", "verify", "commit", "push"]):
-                expansions += ["pytest", "pre-commit", "before push", "tests must pass"]
-            if any(k in ql for k in ["performance", "latency", "query", "database", "index"]):
-                expansions += ["database query performance", "100ms", "index", "optimize query"]
-            if any(k in ql for k in ["framework", "rest", "django", "fastapi", "api"]):
-                expansions += ["FastAPI", "REST", "Django", "OpenAPI docs"]
-
-            # Merge unique expansions with original query
-            if expansions:
-                expanded = q + " \n" + " ".join(sorted(set(expansions)))
-                return expanded
-            return q
-
         expanded_query = _expand_query_text(query)
 
         # Generate query embedding
         logger.debug("searching_memories", query=expanded_query[:80], limit=limit, temporal_decay=temporal_enabled)
-        query_embedding = await self._embedding_service.generate_embedding(expanded_query)
+        query_embedding = await self._embedding_service.generate_query_embedding(expanded_query)
         
         # Build where clause from filters
         where_clause = self._build_where_clause(filters) if filters else None
@@ -326,6 +341,10 @@ class VectorStore:
             # Convert to SearchResult objects
             search_results = []
             current_time = datetime.utcnow()
+            if temporal_enabled:
+                # Blend weights are per-search constants, not per-result
+                semantic_weight = self.config.elefante.temporal_decay.semantic_weight
+                temporal_weight = self.config.elefante.temporal_decay.temporal_weight
             
             if results and results['ids'] and len(results['ids'][0]) > 0:
                 for i in range(len(results['ids'][0])):
@@ -356,8 +375,6 @@ class VectorStore:
                         temporal_score = memory.calculate_relevance_score(current_time)
                         
                         # Blend semantic and temporal scores
-                        semantic_weight = self.config.elefante.temporal_decay.semantic_weight
-                        temporal_weight = self.config.elefante.temporal_decay.temporal_weight
                         final_score = (semantic_weight * similarity) + (temporal_weight * temporal_score)
 
                         # The temporal model can yield values > 1.0 (due to reinforcement).
@@ -8,6 +8,7 @@ for AI assistants to store and retrieve memories.
 
 import asyncio
 import json
+import os
 from typing import Any, Dict, Optional, Sequence
 from datetime import datetime
 from uuid import UUID
@@ -2113,13 +2114,15 @@ You have access to a persistent memory system called **Elefante** - the user's s
         self.logger.info("Pre-initializing orchestrator and embedding model...")
         try:
             orchestrator = await self._get_orchestrator()
-            # Trigger model loading by generating a test embedding
-            await orchestrator.embedding_service.generate_embedding("initialization test")
+            # Load the embedding model and open the database connections
+            await orchestrator.prewarm()
             self.logger.info("Orchestrator and embedding model initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to pre-initialize orchestrator: {e}")
             # Continue anyway - will lazy load on first request
         
+        _notify_ready()
+        
         async with stdio_server() as (read_stream, write_stream):
             self.logger.info("MCP Server running on stdio")
             await self.server.run(
@@ -2129,6 +2132,23 @@ You have access to a persistent memory system called **Elefante** - the user's s
             )
 
 
+def _notify_ready() -> None:
+    """Tell a waiting launcher (scripts/restart_elefante.py) that start-up is done.
+
+    The launcher passes a pipe write end in ELEFANTE_READY_FD; one byte
+    marks the server ready, like systemd's sd_notify.
+    """
+    fd = os.environ.pop("ELEFANTE_READY_FD", None)
+    if not fd:
+        return
+    try:
+        os.write(int(fd), b"1")
+        os.close(int(fd))
+    except (ValueError, OSError):
+        # Launcher gone or the variable was not ours; readiness is best-effort
+        pass
+
+
 async def main():
     """Main entry point for MCP server"""
     server = ElefanteMCPServer()
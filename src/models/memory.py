@@ -3,6 +3,7 @@ Memory data models for Elefante - V2.0 Schema
 Enhanced with 3-level taxonomy, relationship tracking, and temporal intelligence
 """
 
+import math
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict, Any, Literal
@@ -269,8 +270,6 @@ class Memory(BaseModel):
         Calculate temporal relevance score
         Combines base importance with temporal factors
         """
-        import math
-        
         if current_time is None:
             current_time = datetime.utcnow()
         
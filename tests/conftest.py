@@ -4,8 +4,38 @@ Pytest configuration and shared fixtures for Elefante test suite.
 
 import pytest
 import os
+import zlib
 from uuid import uuid4
 
+import numpy as np
+
+
+class FakeSentenceTransformer:
+    """
+    Offline stand-in for the SentenceTransformer model.
+
+    Embeds text as a normalized bag of hashed words, so identical texts get
+    identical vectors and texts sharing words score as similar. Every encode()
+    call is recorded in ``calls``.
+    """
+
+    def __init__(self, dimension: int = 768):
+        self.dimension = dimension
+        self.calls = []
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False,
+               normalize_embeddings=True, convert_to_numpy=True):
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), self.dimension))
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, zlib.crc32(word.encode()) % self.dimension] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
 
 @pytest.fixture(autouse=True)
 def allow_test_memories(monkeypatch):
@@ -63,3 +93,20 @@ def isolated_graph_store(tmp_path):
     
     kuzu_dir = tmp_path / "kuzu_db"
     return GraphStore(database_path=str(kuzu_dir))
+
+
+@pytest.fixture
+def offline_embedding_service(monkeypatch):
+    """
+    Install an EmbeddingService backed by FakeSentenceTransformer as the
+    global service, so code paths that embed run without downloading the model.
+
+    The fake model is available as ``service._model``.
+    """
+    from src.core import embeddings
+
+    service = embeddings.EmbeddingService()
+    service._model = FakeSentenceTransformer()
+    service._dimension = service._model.dimension
+    monkeypatch.setattr(embeddings, "_embedding_service", service)
+    return service
@@ -0,0 +1,93 @@
+"""
+Round-trip tests for scripts/backup_elefante_data.py and
+scripts/restore_elefante_data.py - full and incremental archives must
+restore the data dir byte for byte.
+"""
+
+import importlib.util
+import os
+import zipfile
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+
+
+def _load_script(name):
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+backup = _load_script("backup_elefante_data")
+restore = _load_script("restore_elefante_data")
+
+
+def _write(path: Path, data: bytes, mtime: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    os.utime(path, (mtime, mtime))
+
+
+def _snapshot(root: Path) -> dict:
+    """Relative path -> bytes for every file, plus every directory (as None)."""
+    tree = {}
+    for path in root.rglob("*"):
+        tree[path.relative_to(root).as_posix()] = path.read_bytes() if path.is_file() else None
+    return tree
+
+
+def _restore(archive: Path, target: Path) -> None:
+    for source, members in restore._restore_plan(archive):
+        with zipfile.ZipFile(source) as zf:
+            zf.extractall(path=target, members=members)
+
+
+def test_full_and_incremental_backups_restore_byte_for_byte(tmp_path):
+    data_dir = tmp_path / "data"
+    backups = tmp_path / "backups"
+    backups.mkdir()
+    mtime = 1_700_000_000
+
+    _write(data_dir / "kuzu_db", b"kuzu" * 4096, mtime)
+    _write(data_dir / "chroma" / "chroma.sqlite3", os.urandom(300_000), mtime)
+    _write(data_dir / "chroma" / "segment" / "data_level0.bin", bytes(range(256)) * 64, mtime)
+    _write(data_dir / "notes.txt", b"removed before the incremental backup", mtime)
+    (data_dir / "empty_store").mkdir()
+    _write(data_dir / "chroma" / "writer.lock", b"1234|now", mtime)
+
+    full = backups / "elefante_data_backup_20240101_000000.zip"
+    assert backup._write_archive(data_dir, full, jobs=2) == 4
+    full_tree = _snapshot(data_dir)
+    del full_tree["chroma/writer.lock"]
+
+    # Change one file, add one, delete one; the rest must come from the full archive
+    _write(data_dir / "kuzu_db", b"kuzu-v2" * 4096, mtime + 60)
+    _write(data_dir / "chroma" / "segment" / "header.bin", b"new segment header", mtime + 60)
+    (data_dir / "notes.txt").unlink()
+
+    delta = backups / "elefante_data_backup_20240102_000000.zip"
+    assert backup._write_archive(data_dir, delta, jobs=2, baseline=backup._load_baseline(full)) == 2
+    delta_tree = _snapshot(data_dir)
+    del delta_tree["chroma/writer.lock"]
+
+    with zipfile.ZipFile(delta) as zf:
+        assert zf.testzip() is None
+        stored = {name for name in zf.namelist() if not name.endswith("/")}
+    assert stored == {"kuzu_db", "chroma/segment/header.bin", backup.MANIFEST_NAME}
+
+    restored_full = tmp_path / "restored_full"
+    _restore(full, restored_full)
+    assert _snapshot(restored_full) == full_tree
+
+    restored_delta = tmp_path / "restored_delta"
+    _restore(delta, restored_delta)
+    assert _snapshot(restored_delta) == delta_tree
+
+    # A delta of a delta still points unchanged files at the archives holding them
+    chained = backups / "elefante_data_backup_20240103_000000.zip"
+    assert backup._write_archive(data_dir, chained, jobs=1, baseline=backup._load_baseline(delta)) == 0
+    restored_chained = tmp_path / "restored_chained"
+    _restore(chained, restored_chained)
+    assert _snapshot(restored_chained) == delta_tree
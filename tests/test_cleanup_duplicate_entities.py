@@ -0,0 +1,59 @@
+"""
+Tests for scripts/utils/cleanup_duplicate_entities.py - duplicate entities
+are removed while memory nodes that share a title are left alone.
+"""
+
+import gc
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.graph_store import GraphStore
+from src.models.entity import Entity, EntityType
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "utils" / "cleanup_duplicate_entities.py"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("cleanup_duplicate_entities", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def _names_by_type(db_path):
+    graph_store = GraphStore(database_path=db_path)
+    rows = await graph_store.execute_query("MATCH (e:Entity) RETURN e.name AS name, e.type AS type")
+    graph_store.close()
+    return sorted((row["type"], row["name"]) for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_keeps_memories_that_share_a_title(tmp_path):
+    db_path = str(tmp_path / "kuzu_db")
+    graph_store = GraphStore(database_path=db_path)
+    for day, (name, entity_type) in enumerate([
+        ("Release checklist", EntityType.MEMORY),
+        ("Release checklist", EntityType.MEMORY),
+        ("Kuzu", EntityType.TECHNOLOGY),
+        ("Kuzu", EntityType.TECHNOLOGY),
+    ], start=1):
+        await graph_store.create_entity(
+            Entity(name=name, type=entity_type, created_at=datetime(2024, 1, day))
+        )
+    graph_store.close()
+    del graph_store
+    gc.collect()
+
+    removed = await _load_script().cleanup_duplicates(db_path)
+    gc.collect()
+
+    assert removed == 1
+    assert await _names_by_type(db_path) == [
+        ("memory", "Release checklist"),
+        ("memory", "Release checklist"),
+        ("technology", "Kuzu"),
+    ]
@@ -0,0 +1,77 @@
+"""
+Tests for ResultDeduplicator._similarity_matrix - the numpy matrix must give
+the same scores and duplicate groups as the pairwise _cosine_similarity path.
+"""
+
+import numpy as np
+import pytest
+
+from src.core.deduplication import ResultDeduplicator
+from src.models.conversation import SearchCandidate
+
+
+def _candidates():
+    rng = np.random.default_rng(7)
+    base = rng.normal(size=16)
+    embeddings = [
+        base.tolist(),
+        (base * 3.0).tolist(),                              # same direction as the first
+        (base + rng.normal(scale=0.05, size=16)).tolist(),  # near duplicate
+        rng.normal(size=16).tolist(),
+        (-base).tolist(),                                   # opposite: clamps to 0.0
+        None,                                               # missing embedding
+        [0.0] * 16,                                         # zero norm
+        [],                                                 # empty embedding
+        None,
+        [0.0] * 16,
+    ]
+    return [
+        SearchCandidate(text=f"candidate {i}", score=0.5, source="semantic", embedding=embedding)
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+def _pairwise_groups(deduplicator, candidates, monkeypatch):
+    """Duplicate groups from the old per-pair path."""
+    with monkeypatch.context() as patch:
+        patch.setattr(deduplicator, "_similarity_matrix", lambda _: None)
+        return deduplicator._find_duplicate_groups(candidates)
+
+
+def test_similarity_matrix_matches_pairwise_scores():
+    deduplicator = ResultDeduplicator()
+    candidates = _candidates()
+
+    similarities = deduplicator._similarity_matrix(candidates)
+
+    assert similarities.shape == (len(candidates), len(candidates))
+    for i, first in enumerate(candidates):
+        for j, second in enumerate(candidates):
+            if i == j:
+                continue
+            if first.embedding is None or second.embedding is None:
+                # The pairwise path skips these pairs; the matrix never groups them
+                assert similarities[i, j] < 0.0
+            else:
+                expected = deduplicator._cosine_similarity(first.embedding, second.embedding)
+                assert similarities[i, j] == pytest.approx(expected, abs=1e-12)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold", [0.95, 0.5, 0.0])
+async def test_similarity_matrix_groups_match_pairwise_groups(threshold, monkeypatch):
+    deduplicator = ResultDeduplicator(threshold=threshold)
+    candidates = _candidates()
+
+    groups = await deduplicator._find_duplicate_groups(candidates)
+
+    assert groups == await _pairwise_groups(deduplicator, candidates, monkeypatch)
+
+
+def test_similarity_matrix_without_embeddings_groups_nothing():
+    deduplicator = ResultDeduplicator()
+    candidates = [
+        SearchCandidate(text=f"candidate {i}", score=0.5, source="semantic") for i in range(3)
+    ]
+
+    assert (deduplicator._similarity_matrix(candidates) < 0.0).all()
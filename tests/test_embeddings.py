@@ -0,0 +1,85 @@
+"""
+Tests for EmbeddingService.generate_query_embedding - the query LRU cache and
+the sharing of in-flight encodes between concurrent lookups.
+
+The model is the offline FakeSentenceTransformer from conftest.py, which
+records every encode() call.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_query_cache_hit_skips_the_model(offline_embedding_service):
+    service = offline_embedding_service
+    model = service._model
+
+    first = await service.generate_query_embedding("kuzu graph")
+    second = await service.generate_query_embedding("kuzu graph")
+
+    assert second == first
+    assert model.calls == [["kuzu graph"]]
+    assert service.get_cache_info()["hits"] == 1
+    assert service.get_cache_info()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_query_cache_evicts_least_recently_used(offline_embedding_service):
+    service = offline_embedding_service
+    model = service._model
+    service._query_cache_size = 2
+
+    await service.generate_query_embedding("a")
+    await service.generate_query_embedding("b")
+    await service.generate_query_embedding("a")  # hit: "a" becomes most recent
+    await service.generate_query_embedding("c")  # evicts "b", not "a"
+
+    assert list(service._query_cache) == ["a", "c"]
+    assert model.calls == [["a"], ["b"], ["c"]]
+
+    await service.generate_query_embedding("a")
+    await service.generate_query_embedding("b")
+    assert model.calls == [["a"], ["b"], ["c"], ["b"]]
+    assert len(service._query_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_encode(offline_embedding_service):
+    service = offline_embedding_service
+    model = service._model
+
+    results = await asyncio.gather(
+        *(service.generate_query_embedding("shared query") for _ in range(3))
+    )
+
+    assert model.calls == [["shared query"]]
+    assert results[0] == results[1] == results[2]
+    assert service._query_pending == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_encode_leaves_no_pending_entry(offline_embedding_service, monkeypatch):
+    service = offline_embedding_service
+    model = service._model
+
+    def failing_encode(texts, **kwargs):
+        raise RuntimeError("encode failed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(model, "encode", failing_encode)
+        results = await asyncio.gather(
+            service.generate_query_embedding("broken query"),
+            service.generate_query_embedding("broken query"),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert service._query_pending == {}
+    assert "broken query" not in service._query_cache
+
+    # The next lookup encodes again instead of reusing the failed future
+    embedding = await service.generate_query_embedding("broken query")
+    assert model.calls == [["broken query"]]
+    assert list(service._query_cache["broken query"]) == embedding
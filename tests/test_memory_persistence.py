@@ -37,6 +37,20 @@ class TestMemoryPersistence:
         orch._test_collection_name = vector_store.collection_name
         orch._test_kuzu_dir = kuzu_dir
         return orch
+
+    @pytest.fixture
+    def offline_orchestrator(self, offline_embedding_service, tmp_path):
+        """Isolated orchestrator whose embeddings come from the offline fake model"""
+        vector_store = VectorStore(
+            collection_name=f"test_memory_persistence_{uuid4().hex}",
+            persist_directory=str(tmp_path / "chroma"),
+        )
+        graph_store = GraphStore(database_path=str(tmp_path / "kuzu_db"))
+        return MemoryOrchestrator(
+            vector_store=vector_store,
+            graph_store=graph_store,
+            embedding_service=offline_embedding_service,
+        )
     
     @pytest.mark.asyncio
     async def test_add_memory_persists_to_vector_store(self, orchestrator):
@@ -226,6 +240,85 @@ class TestMemoryPersistence:
         # Should have at least one relationship
         assert len(rel_results) > 0, "No relationships found for entity"
     
+    @pytest.mark.asyncio
+    async def test_add_memories_persists_each_item(self, offline_orchestrator):
+        """Test that the bulk API embeds once and stores every memory in order"""
+        orchestrator = offline_orchestrator
+        contents = [f"Bulk add test {i} {uuid4()}" for i in range(2)]
+
+        memories = await orchestrator.add_memories([
+            {"content": content, "memory_type": "fact", "importance": 6}
+            for content in contents
+        ])
+
+        # Both contents went through the model in a single batch
+        assert contents in orchestrator.embedding_service._model.calls
+        assert len(memories) == len(contents)
+        for content, memory in zip(contents, memories):
+            assert memory is not None
+            assert memory.content == content
+            reloaded = await orchestrator.vector_store.get_memory(memory.id)
+            assert reloaded is not None
+
+    @pytest.mark.asyncio
+    async def test_enqueue_memory_persists_after_flush(self, offline_orchestrator):
+        """Test that queued memories are all written once flush() returns"""
+        orchestrator = offline_orchestrator
+        contents = [f"Queued add test {i} {uuid4()}" for i in range(2)]
+
+        pending = [
+            orchestrator.enqueue_memory({"content": content, "memory_type": "fact", "importance": 6})
+            for content in contents
+        ]
+        await orchestrator.flush()
+
+        # Items queued together are drained as one batch
+        assert contents in orchestrator.embedding_service._model.calls
+        for content, future in zip(contents, pending):
+            assert future.done()
+            memory = future.result()
+            assert memory is not None
+            assert memory.content == content
+            reloaded = await orchestrator.vector_store.get_memory(memory.id)
+            assert reloaded is not None
+        await orchestrator.close()
+
+    @pytest.mark.asyncio
+    async def test_search_memories_batch_matches_sequential_searches(self, offline_orchestrator):
+        """Test that batched searches return what one search_memories call per query returns"""
+        orchestrator = offline_orchestrator
+        await orchestrator.add_memories([
+            {"content": content, "memory_type": "fact", "importance": 6}
+            for content in (
+                "Kuzu stores the knowledge graph on disk",
+                "ChromaDB holds the memory embeddings",
+                "The dashboard reads the knowledge graph snapshot",
+            )
+        ])
+        queries = ["knowledge graph", "memory embeddings"]
+        search_kwargs = {
+            "mode": QueryMode.SEMANTIC,
+            "limit": 5,
+            "min_similarity": 0.0,
+            "include_conversation": False,
+            "apply_temporal_decay": False,
+        }
+
+        def summarize(results):
+            return [(str(r.memory.id), round(r.score, 6)) for r in results]
+
+        sequential = [
+            summarize(await orchestrator.search_memories(query, **search_kwargs))
+            for query in queries
+        ]
+        orchestrator.embedding_service.clear_cache()
+        batched = await orchestrator.search_memories_batch(queries, **search_kwargs)
+
+        assert [summarize(results) for results in batched] == sequential
+        assert all(sequential), "Expected every query to find a memory"
+        # The uncached queries were embedded together in one forward pass
+        assert queries in orchestrator.embedding_service._model.calls
+
     @pytest.mark.asyncio
     async def test_hybrid_search_returns_persisted_memories(self, orchestrator):
         """Test that hybrid search finds persisted memories"""
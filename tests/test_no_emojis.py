@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import importlib.util
+import sys
 import unicodedata
 from pathlib import Path
 
@@ -85,3 +87,43 @@ def test_repo_contains_no_emojis() -> None:
         "Emoji violations found (first 50 shown; output omits emoji characters):\n"
         + "\n".join(violations)
     )
+
+
+def _load_emoji_policy():
+    path = Path(__file__).resolve().parents[1] / "scripts" / "emoji_policy.py"
+    spec = importlib.util.spec_from_file_location("emoji_policy", path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered first: its dataclasses resolve annotations through sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+emoji_policy = _load_emoji_policy()
+
+
+def _positions(text: str) -> list[tuple[int, int]]:
+    return [(v.line, v.col) for v in emoji_policy.find_violations_in_text(text, Path("sample.md"))]
+
+
+# Emoji are written as escapes so this file stays within the policy
+GRINNING = "\U0001F600"
+ROCKET = "\U0001F680"
+
+
+def test_find_violations_reports_line_and_column_across_lines() -> None:
+    text = f"first line\nsecond {GRINNING} here {ROCKET}\n\nplain\nend {GRINNING}\n"
+
+    assert _positions(text) == [(2, 8), (2, 15), (5, 5)]
+
+
+def test_find_violations_without_trailing_newline() -> None:
+    text = f"one\ntwo\nthree{ROCKET}"
+
+    assert _positions(text) == [(3, 6)]
+
+
+def test_find_violations_at_column_one() -> None:
+    text = f"{GRINNING}start\n{ROCKET}\n\n{GRINNING}{ROCKET} pair"
+
+    assert _positions(text) == [(1, 1), (2, 1), (4, 1), (4, 2)]